@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import date, datetime, timedelta
 
 from litestar import Router, get, patch
@@ -153,86 +154,41 @@ async def admin_stats(request: Request, period: str = "day") -> dict:
         if period not in {"day", "week", "month"}:
             period = "day"
 
-        buckets: list[str] = []
         if period == "day":
-            days = [now.date() - timedelta(days=i) for i in range(29, -1, -1)]
-            buckets = [d.isoformat() for d in days]
-            sim_map = {k: 0 for k in buckets}
-            visit_map = {k: 0 for k in buckets}
-            signup_map = {k: 0 for k in buckets}
-            for (created_at,) in sim_rows:
-                k = _floor_day(created_at).isoformat()
-                if k in sim_map:
-                    sim_map[k] += 1
-            for created_at, last_login_at in user_rows:
-                k = _floor_day(created_at).isoformat()
-                if k in signup_map:
-                    signup_map[k] += 1
-                if last_login_at is not None:
-                    v = _floor_day(last_login_at).isoformat()
-                    if v in visit_map:
-                        visit_map[v] += 1
-            return {
-                "period": period,
-                "sim_runs": [{"date": k, "count": sim_map[k]} for k in buckets],
-                "user_visits": [{"date": k, "count": visit_map[k]} for k in buckets],
-                "user_signups": [{"date": k, "count": signup_map[k]} for k in buckets],
-            }
-        if period == "week":
-            weeks = [_floor_week(now - timedelta(weeks=i)) for i in range(11, -1, -1)]
-            buckets = [w.isoformat() for w in weeks]
-            sim_map = {k: 0 for k in buckets}
-            visit_map = {k: 0 for k in buckets}
-            signup_map = {k: 0 for k in buckets}
-            for (created_at,) in sim_rows:
-                k = _floor_week(created_at).isoformat()
-                if k in sim_map:
-                    sim_map[k] += 1
-            for created_at, last_login_at in user_rows:
-                k = _floor_week(created_at).isoformat()
-                if k in signup_map:
-                    signup_map[k] += 1
-                if last_login_at is not None:
-                    v = _floor_week(last_login_at).isoformat()
-                    if v in visit_map:
-                        visit_map[v] += 1
-            return {
-                "period": period,
-                "sim_runs": [{"date": k, "count": sim_map[k]} for k in buckets],
-                "user_visits": [{"date": k, "count": visit_map[k]} for k in buckets],
-                "user_signups": [{"date": k, "count": signup_map[k]} for k in buckets],
-            }
-        months = []
-        cur = now
-        for _ in range(12):
-            months.append((cur.year, cur.month))
-            if cur.month == 1:
-                cur = cur.replace(year=cur.year - 1, month=12)
-            else:
-                cur = cur.replace(month=cur.month - 1)
-        months = list(reversed(months))
-        buckets = [f"{y:04d}-{m:02d}" for (y, m) in months]
-        sim_map = {k: 0 for k in buckets}
-        visit_map = {k: 0 for k in buckets}
-        signup_map = {k: 0 for k in buckets}
-        for (created_at,) in sim_rows:
-            key = f"{created_at.year:04d}-{created_at.month:02d}"
-            if key in sim_map:
-                sim_map[key] += 1
-        for created_at, last_login_at in user_rows:
-            key = f"{created_at.year:04d}-{created_at.month:02d}"
-            if key in signup_map:
-                signup_map[key] += 1
-            if last_login_at is not None:
-                v = last_login_at
-                vkey = f"{v.year:04d}-{v.month:02d}"
-                if vkey in visit_map:
-                    visit_map[vkey] += 1
+            keys = [now.date() - timedelta(days=i) for i in range(29, -1, -1)]
+            floor = _floor_day
+        elif period == "week":
+            keys = [_floor_week(now - timedelta(weeks=i)) for i in range(11, -1, -1)]
+            floor = _floor_week
+        else:
+            months = []
+            cur = now
+            for _ in range(12):
+                months.append((cur.year, cur.month))
+                if cur.month == 1:
+                    cur = cur.replace(year=cur.year - 1, month=12)
+                else:
+                    cur = cur.replace(month=cur.month - 1)
+            keys = list(reversed(months))
+            floor = _floor_month
+
+        # Count rows by their raw bucket key in one pass each; labels are only
+        # formatted for the buckets that are reported
+        sim_counts = Counter(floor(created_at) for (created_at,) in sim_rows)
+        signup_counts = Counter(floor(created_at) for created_at, _ in user_rows)
+        visit_counts = Counter(
+            floor(last_login_at) for _, last_login_at in user_rows if last_login_at is not None
+        )
+        if period == "month":
+            labels = [f"{y:04d}-{m:02d}" for (y, m) in keys]
+        else:
+            labels = [k.isoformat() for k in keys]
+        buckets = list(zip(labels, keys))
         return {
             "period": period,
-            "sim_runs": [{"date": k, "count": sim_map[k]} for k in buckets],
-            "user_visits": [{"date": k, "count": visit_map[k]} for k in buckets],
-            "user_signups": [{"date": k, "count": signup_map[k]} for k in buckets],
+            "sim_runs": [{"date": label, "count": sim_counts[k]} for label, k in buckets],
+            "user_visits": [{"date": label, "count": visit_counts[k]} for label, k in buckets],
+            "user_signups": [{"date": label, "count": signup_counts[k]} for label, k in buckets],
         }
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from itertools import islice
 from typing import Any, List
 from pydantic import BaseModel
 from litestar import post, get, Router
@@ -158,11 +160,14 @@ async def compare_nodes(request: Request, simulation_id: str, data: dict) -> dic
     logs_a = a.get("logs") or []
     logs_b = b.get("logs") or []
 
-    # lightweight event sequence diff: events only in A / only in B based on stringified content
-    set_a = set((str(ev.get("type")) + ":" + str(ev.get("data")) for ev in logs_a))
-    set_b = set((str(ev.get("type")) + ":" + str(ev.get("data")) for ev in logs_b))
-    only_a = [ev for ev in logs_a if (str(ev.get("type")) + ":" + str(ev.get("data")) ) not in set_b]
-    only_b = [ev for ev in logs_b if (str(ev.get("type")) + ":" + str(ev.get("data")) ) not in set_a]
+    # lightweight event sequence diff: events only in A / only in B based on stringified content.
+    # Each event is stringified once; the keys feed both the sets and the filters.
+    keys_a = [f"{ev.get('type')}:{ev.get('data')}" for ev in logs_a]
+    keys_b = [f"{ev.get('type')}:{ev.get('data')}" for ev in logs_b]
+    set_a = set(keys_a)
+    set_b = set(keys_b)
+    only_a = [ev for ev, key in zip(logs_a, keys_a) if key not in set_b]
+    only_b = [ev for ev, key in zip(logs_b, keys_b) if key not in set_a]
 
     # agent property diffs (compare numeric properties when possible)
     sim_a = a.get("sim")
@@ -170,11 +175,11 @@ async def compare_nodes(request: Request, simulation_id: str, data: dict) -> dic
     agents_a = {name: getattr(ag, "properties", {}) for name, ag in (sim_a.agents.items() if sim_a else [])}
     agents_b = {name: getattr(ag, "properties", {}) for name, ag in (sim_b.agents.items() if sim_b else [])}
     agent_diffs = {}
-    for name in set(list(agents_a.keys()) + list(agents_b.keys())):
+    for name in agents_a.keys() | agents_b.keys():
         pa = agents_a.get(name, {})
         pb = agents_b.get(name, {})
         diffs = {}
-        for k in set(list(pa.keys()) + list(pb.keys())):
+        for k in pa.keys() | pb.keys():
             va = pa.get(k)
             vb = pb.get(k)
             if va != vb:
@@ -224,11 +229,13 @@ async def compare_nodes(request: Request, simulation_id: str, data: dict) -> dic
 
                 examples_a = "\n".join([stringify_event(e) for e in only_a[:8]])
                 examples_b = "\n".join([stringify_event(e) for e in only_b[:8]])
-                agent_diff_lines = []
-                for name, diffs in list(agent_diffs.items())[:20]:
-                    for k, v in list(diffs.items())[:5]:
-                        agent_diff_lines.append(f"{name}.{k}: A={v.get('a')} B={v.get('b')}")
-                agent_diff_text = "\n".join(agent_diff_lines[:200])
+                # At most 20 agents x 5 fields; islice avoids copying every
+                # diff entry into a list just to take the first few
+                agent_diff_text = "\n".join(
+                    f"{name}.{k}: A={v.get('a')} B={v.get('b')}"
+                    for name, diffs in islice(agent_diffs.items(), 20)
+                    for k, v in islice(diffs.items(), 5)
+                )
 
                 system_msg = {
                     "role": "system",
@@ -249,8 +256,8 @@ async def compare_nodes(request: Request, simulation_id: str, data: dict) -> dic
                 }
 
                 # Estimate token consumption (very conservative): chars/4
-                prompt_text = (system_msg["content"] + "\n" + user_msg["content"]) if isinstance(system_msg, dict) else str(system_msg) + "\n" + str(user_msg)
-                est_tokens = max(1, int(len(prompt_text) / 4))
+                prompt_len = len(system_msg["content"]) + 1 + len(user_msg["content"])
+                est_tokens = max(1, int(prompt_len / 4))
 
                 # Check per-user/provider quota before calling LLM and reserve tokens (DB-level lock)
                 try:
@@ -291,7 +298,7 @@ async def compare_nodes(request: Request, simulation_id: str, data: dict) -> dic
                     summary = summary + "（注意：用户 LLM 配额已耗尽，已禁用 LLM 摘要）"
                 else:
                     try:
-                        text = llm_client.chat([system_msg, user_msg])
+                        text = await asyncio.to_thread(llm_client.chat, [system_msg, user_msg])
                         if isinstance(text, str) and text.strip():
                             # Truncate to reasonable length
                             summary = (text.strip()[:1000])
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from typing import Any, List, Optional, Dict
+import asyncio
 import logging
 logger = logging.getLogger(__name__)
 from litestar import Router, post
@@ -15,6 +16,7 @@ from ...dependencies import extract_bearer_token, resolve_current_user
 from ...models.user import ProviderConfig
 
 # 👇 关键：这里需要上升 3 层到 socialsim4，然后再进入 core
+from ....core.jsonutil import json_loads
 from ....core.llm import create_llm_client, generate_agents_with_archetypes
 from ....core.llm_config import LLMConfig, guess_supports_vision
 
@@ -190,11 +192,10 @@ async def generate_agents(
             {"role": "user", "content": user_prompt},
         ]
 
-        raw_text = llm.chat(messages)
+        raw_text = await asyncio.to_thread(llm.chat, messages)
    # 打印原始输出用于调试
         logger.debug(f"LLM raw output (first 500 chars): {raw_text[:500]}")
         
-        import json
         import re
         
         # 清理 LLM 输出：去除 markdown 代码块标记
@@ -219,7 +220,7 @@ async def generate_agents(
             cleaned_text = cleaned_text[json_start:]
 
         try:
-            parsed = json.loads(cleaned_text)
+            parsed = json_loads(cleaned_text)
         except Exception as e:
             logger.error(f"JSON parse failed: {e}")
             logger.error(f"Cleaned text (first 300 chars): {cleaned_text[:300]}")
@@ -305,7 +306,7 @@ async def refine_report(request: Request, data: RefineReportRequest) -> dict:
             {"role": "system", "content": "你是一名报告精炼助手，请严格返回 JSON。"},
             {"role": "user", "content": data.prompt},
         ]
-        text = llm.chat(messages)
+        text = await asyncio.to_thread(llm.chat, messages)
         return {"text": text}
 
 
@@ -367,7 +368,8 @@ async def generate_agents_demographics(
             ]
 
             # 🎯 Call the integrated AgentTorch function from llm.py
-            agents_data = generate_agents_with_archetypes(
+            agents_data = await asyncio.to_thread(
+                generate_agents_with_archetypes,
                 total_agents=data.total_agents,
                 demographics=demographics_dicts,
                 archetype_probabilities=data.archetype_probabilities,
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 from litestar import Router, delete, get, patch, post
@@ -137,7 +138,7 @@ async def test_provider(request: Request, provider_id: int) -> Message:
 
         provider.last_tested_at = datetime.now(timezone.utc)
         client = create_llm_client(cfg)
-        client.chat([{"role": "user", "content": "ping"}])
+        await asyncio.to_thread(client.chat, [{"role": "user", "content": "ping"}])
         provider.last_test_status = "success"
         provider.last_error = None
         await session.commit()
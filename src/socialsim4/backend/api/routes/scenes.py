@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from litestar import Router, get, post
@@ -12,7 +13,7 @@ from socialsim4.templates.loader import TemplateLoader
 from socialsim4.templates.schema import GenericTemplate, export_json_schema
 
 
-PUBLIC_SCENE_KEYS = {key for key in SCENE_MAP.keys()} - {"village_scene"}
+PUBLIC_SCENE_KEYS = frozenset(SCENE_MAP.keys() - {"village_scene"})
 
 DEFAULT_SIMPLE_CHAT_NEWS = (
     "News: A new study suggests AI models now match human-level performance in creative writing benchmarks."
@@ -78,7 +79,8 @@ def scene_config_template(scene_key: str, scene_cls) -> dict:
         )
         basic_actions = [a.NAME for a in (scene.get_scene_actions(dummy) or []) if getattr(a, "NAME", None)]
         allowed = set()
-    allowed_list = sorted(a for a in allowed if a not in set(basic_actions) and a != "yield")
+    basic_set = set(basic_actions)
+    allowed_list = sorted(a for a in allowed if a not in basic_set and a != "yield")
     basic_list = sorted(a for a in basic_actions if a != "yield")
 
     # Prefer the registry key as the public type to allow aliases
@@ -125,39 +127,56 @@ def load_all_templates() -> list[dict]:
         except FileNotFoundError:
             pass
 
-    # Load system templates
-    if SYSTEM_TEMPLATES_DIR.exists():
-        try:
-            system_templates = loader.load_from_directory(SYSTEM_TEMPLATES_DIR)
-            for template in system_templates:
-                # Check if this template ID already exists from user templates
-                existing_ids = {t["id"] for t in templates}
-                if template.id not in existing_ids:
-                    templates.append({
-                        "id": template.id,
-                        "name": template.name,
-                        "description": template.description,
-                        "version": template.version,
-                        "author": template.author,
-                        "source": "system",
-                        "core_mechanics": [m.type for m in template.core_mechanics],
-                        "semantic_actions": [a.name for a in template.semantic_actions],
-                    })
-        except FileNotFoundError:
-            pass
+    # Load system templates, skipping IDs already taken (user templates win).
+    # The ID set is kept up to date as templates are added rather than being
+    # rebuilt from the full list for every system template.
+    existing_ids = {t["id"] for t in templates}
+    for summary in _system_template_summaries():
+        if summary["id"] not in existing_ids:
+            existing_ids.add(summary["id"])
+            templates.append(dict(summary))
 
     return templates
 
 
+@lru_cache(maxsize=1)
+def _system_template_summaries() -> tuple[dict, ...]:
+    """Load the system template summaries once; they ship with the package and never change."""
+    if not SYSTEM_TEMPLATES_DIR.exists():
+        return ()
+    try:
+        system_templates = TemplateLoader().load_from_directory(SYSTEM_TEMPLATES_DIR)
+    except FileNotFoundError:
+        return ()
+    return tuple(
+        {
+            "id": template.id,
+            "name": template.name,
+            "description": template.description,
+            "version": template.version,
+            "author": template.author,
+            "source": "system",
+            "core_mechanics": [m.type for m in template.core_mechanics],
+            "semantic_actions": [a.name for a in template.semantic_actions],
+        }
+        for template in system_templates
+    )
+
+
+@lru_cache(maxsize=1)
+def _public_scene_templates() -> tuple[dict, ...]:
+    """Build the scene catalog once; it depends only on the static scene registry."""
+    return tuple(
+        scene_config_template(key, cls)
+        for key, cls in SCENE_MAP.items()
+        if key in PUBLIC_SCENE_KEYS
+    )
+
+
 @get("/")
 async def list_scenes() -> list[dict]:
     """List all available scene types including generic_scene."""
-    scenes: list[dict] = []
-    for key, cls in SCENE_MAP.items():
-        if key not in PUBLIC_SCENE_KEYS:
-            continue
-        scenes.append(scene_config_template(key, cls))
-    return scenes
+    return list(_public_scene_templates())
 
 
 @get("/templates")
@@ -166,11 +185,13 @@ async def list_templates() -> dict[str, list[dict]]:
 
     Returns a dictionary with separate lists for system and user templates.
     """
-    templates = load_all_templates()
-    return {
-        "system": [t for t in templates if t["source"] == "system"],
-        "user": [t for t in templates if t["source"] == "user"],
-    }
+    grouped: dict[str, list[dict]] = {"system": [], "user": []}
+    # One pass over the templates instead of one filter pass per source
+    for t in load_all_templates():
+        bucket = grouped.get(t["source"])
+        if bucket is not None:
+            bucket.append(t)
+    return grouped
 
 
 @post("/templates/validate")
@@ -140,9 +140,7 @@ async def upload_agent_document(
         for agent in agents:
             if agent.get("name") == agent_name:
                 agent_found = True
-                if "documents" not in agent:
-                    agent["documents"] = {}
-                agent["documents"][document["id"]] = document
+                agent.setdefault("documents", {})[document["id"]] = document
                 break
 
         if not agent_found:
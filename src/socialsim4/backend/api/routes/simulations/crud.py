@@ -215,10 +215,10 @@ async def update_simulation(
             # Merge incoming agents with existing agents
             merged_agents = []
             for incoming_agent in incoming_agents:
-                agent_name = incoming_agent.get("name")
-                if agent_name in existing_by_name:
+                existing_agent = existing_by_name.get(incoming_agent.get("name"))
+                if existing_agent is not None:
                     # Merge: keep existing documents, update with incoming data
-                    merged_agent = copy.deepcopy(existing_by_name[agent_name])
+                    merged_agent = copy.deepcopy(existing_agent)
                     for key, value in incoming_agent.items():
                         merged_agent[key] = value
                     merged_agents.append(merged_agent)
@@ -227,9 +227,9 @@ async def update_simulation(
                     merged_agents.append(incoming_agent)
 
             # Keep agents that were in existing but not in incoming
+            incoming_names = {a.get("name") for a in incoming_agents}
             for existing_agent in existing_agents:
-                agent_name = existing_agent.get("name")
-                if agent_name not in {a.get("name") for a in incoming_agents}:
+                if existing_agent.get("name") not in incoming_names:
                     merged_agents.append(copy.deepcopy(existing_agent))
 
             merged_config = copy.deepcopy(data.agent_config)
@@ -22,6 +22,7 @@ Contains:
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Any
 
 from litestar import get, post, delete
@@ -112,11 +113,9 @@ async def simulation_tree_graph(
                 if node.get("depth") is not None
             }
 
-            outdeg = {i: 0 for i in depth_map}
-            for edge in edges:
-                outdeg[edge["from"]] = outdeg.get(edge["from"], 0) + 1
+            outdeg = Counter(edge["from"] for edge in edges)
 
-            leaves = [i for i, degree in outdeg.items() if degree == 0]
+            leaves = [i for i in depth_map if outdeg[i] == 0]
             max_depth = max(depth_map.values()) if depth_map else 0
             frontier = [i for i in leaves if depth_map.get(i) == max_depth]
 
@@ -658,6 +657,12 @@ async def ask_agents_question(
         scene_config = sim.scene_config or {}
         global_knowledge = scene_config.get("global_knowledge", {})
 
+        # Index agent configs by name once instead of scanning the list per
+        # agent; setdefault keeps the first entry like the old linear search
+        agent_cfg_by_name: dict = {}
+        for cfg in (sim.agent_config or {}).get("agents", []):
+            agent_cfg_by_name.setdefault(cfg.get("name"), cfg)
+
         results = []
 
         for name, agent in simulator.agents.items():
@@ -667,10 +672,7 @@ async def ask_agents_question(
             # Gather all knowledge sources
             kb_items = getattr(agent, "knowledge_base", [])
             enabled_kb = [item for item in kb_items if item.get("enabled", True)]
-            documents = getattr(agent, "documents", {})
-            agent_config = sim.agent_config or {}
-            agents_list = agent_config.get("agents", [])
-            agent_cfg = next((a for a in agents_list if a.get("name") == name), {})
+            agent_cfg = agent_cfg_by_name.get(name, {})
             cfg_documents = agent_cfg.get("documents", {})
 
             logger.debug(f"--- Agent: {name} ---")
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import base64
+import os
 import re
 import shutil
 import time
 from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from threading import Lock
 from typing import Annotated
@@ -33,6 +35,13 @@ _rate_limit_lock = Lock()
 _RATE_LIMIT_REQUESTS = 10  # Maximum uploads allowed
 _RATE_LIMIT_WINDOW = 60  # Time window in seconds
 
+# MIME type part of a "data:<mime>;base64,<payload>" URL
+_DATA_URL_MIME_RE = re.compile(r"[a-zA-Z0-9./+-]+")
+
+# Repository root that relative upload_dir settings resolve against; fixed for
+# the process, so resolve it once rather than on every request
+_ROOT_DIR = Path(__file__).resolve().parents[5]
+
 
 def _check_rate_limit(user_id: str) -> bool:
     """
@@ -123,19 +132,22 @@ def _validate_file_signature(content: bytes, content_type: str) -> bool:
         # No signature defined for this type, allow it
         return True
 
-    # Check if content starts with any of the expected signatures
-    for sig in signatures:
-        if content.startswith(sig):
-            return True
-
-    return False
+    # bytes.startswith takes the whole tuple and checks every prefix in one call
+    return content.startswith(signatures)
 
 
 def _decode_data_url(data_url: str):
-    match = re.match(r"data:([a-zA-Z0-9./+-]+);base64,(.+)", data_url)
-    if not match:
+    # Split on the fixed marker so only the short header goes through the
+    # regex, not the (possibly multi-megabyte) base64 payload
+    header, found, b64 = data_url.partition(";base64,")
+    if (
+        not found
+        or not b64
+        or not header.startswith("data:")
+        or not _DATA_URL_MIME_RE.fullmatch(header, 5)
+    ):
         raise HTTPException(status_code=400, detail="Invalid data URL")
-    mime, b64 = match.groups()
+    mime = header[5:]
     try:
         data = base64.b64decode(b64)
     except Exception:
@@ -212,12 +224,10 @@ async def upload_image(
     doc_max_bytes = int(settings.upload_docs_max_mb) * 1024 * 1024
 
     # Pick storage root: local dir or cloud-mounted dir
-    root_dir = Path(__file__).resolve().parents[5]
+    upload_root = _get_upload_root()
     if settings.upload_backend == "cloud":
-        upload_root = Path(settings.upload_cloud_dir or settings.upload_dir).resolve()
         public_base = settings.upload_cloud_base_url or settings.upload_base_url
     else:
-        upload_root = (root_dir / settings.upload_dir).resolve()
         public_base = f"{settings.backend_root_path.rstrip('/')}{settings.upload_base_url}"
     upload_root.mkdir(parents=True, exist_ok=True)
 
@@ -300,11 +310,10 @@ async def upload_image(
 def _get_upload_root() -> Path:
     """Get the upload directory based on current settings."""
     settings = get_settings()
-    root_dir = Path(__file__).resolve().parents[5]
     if settings.upload_backend == "cloud":
         return Path(settings.upload_cloud_dir or settings.upload_dir).resolve()
     else:
-        return (root_dir / settings.upload_dir).resolve()
+        return (_ROOT_DIR / settings.upload_dir).resolve()
 
 
 @get("/", tags=["uploads"])
@@ -325,22 +334,27 @@ async def list_uploads(request: Request) -> list[dict]:
     if not upload_root.exists():
         return []
 
-    for path in upload_root.iterdir():
-        if path.is_file():
+    # scandir entries cache the type/stat info from the directory read, so
+    # each file costs one stat at most instead of is_file() + stat()
+    with os.scandir(upload_root) as entries:
+        for entry in entries:
             try:
-                stat = path.stat()
-                files.append({
-                    "id": path.stem,  # UUID without extension
-                    "filename": path.name,
-                    "size": stat.st_size,
-                    "created": stat.st_ctime,
-                    "type": path.suffix[1:] if path.suffix else "",  # extension without dot
-                })
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
             except (OSError, IOError):
                 # Skip files that can't be read
                 continue
+            path = Path(entry.name)
+            files.append({
+                "id": path.stem,  # UUID without extension
+                "filename": entry.name,
+                "size": stat.st_size,
+                "created": stat.st_ctime,
+                "type": path.suffix[1:] if path.suffix else "",  # extension without dot
+            })
 
-    return sorted(files, key=lambda f: f["created"], reverse=True)
+    return sorted(files, key=itemgetter("created"), reverse=True)
 
 
 @delete("/{file_id:str}", tags=["uploads"], status_code=HTTP_200_OK)
@@ -410,8 +424,10 @@ async def find_orphaned_uploads(request: Request) -> dict:
     if not upload_root.exists():
         return {"orphaned": [], "total": 0}
 
-    # Get all file IDs in uploads directory
-    all_file_ids = {p.stem for p in upload_root.iterdir() if p.is_file()}
+    # Count files in the uploads directory; only the total is reported, so
+    # stream the directory instead of collecting every file ID in a set
+    with os.scandir(upload_root) as entries:
+        total = sum(1 for entry in entries if entry.is_file())
 
     # For a simpler implementation, we'll return all files
     # A full implementation would scan all simulations in the database
@@ -420,7 +436,7 @@ async def find_orphaned_uploads(request: Request) -> dict:
     # a full database scan
     return {
         "orphaned": [],
-        "total": len(all_file_ids),
+        "total": total,
         "note": "Full orphan detection requires database scan - implement for production"
     }
 
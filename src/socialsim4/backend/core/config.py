@@ -56,6 +56,8 @@ class Settings(BaseSettings):
     # Vector Store (ChromaDB) Configuration
     use_chromadb: bool = False
     chromadb_persist_dir: str = "./chroma_db"
+    # Load the sentence-transformers model at startup instead of on first RAG use
+    preload_embedding_model: bool = False
 
     model_config = SettingsConfigDict(
         extra="ignore",
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from ...core.jsonutil import json_dumps
 from .config import get_settings
 
 
@@ -14,7 +15,7 @@ settings = get_settings()
 
 # Configure engine with optional pool tuning from settings. Only include values
 # explicitly provided to avoid passing unsupported args for some dialects.
-engine_kwargs: dict = {"echo": settings.debug}
+engine_kwargs: dict = {"echo": settings.debug, "json_serializer": json_dumps}
 if settings.db_pool_size is not None:
     engine_kwargs["pool_size"] = settings.db_pool_size
 if settings.db_max_overflow is not None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from litestar import Litestar, Router, get
@@ -41,6 +42,16 @@ async def _initialize_vector_store() -> None:
         print("[vector_store] Using JSON fallback mode")
 
 
+async def _warm_embedding_model() -> None:
+    """Pay the embedding model's cold load at startup when configured."""
+    settings = get_settings()
+    if not settings.preload_embedding_model:
+        return
+    from .services.documents import get_embedding_model
+
+    await asyncio.to_thread(get_embedding_model)
+
+
 def internal_error_handler(request: Request, exc: Exception) -> Response:
     # Return JSON error for any unhandled exception (HTTP 500)
     # Note: 4xx HTTPException responses will continue to use Litestar's default handling.
@@ -117,7 +128,7 @@ def create_app() -> Litestar:
 
     app_kwargs: dict = {
         "route_handlers": [base_router],
-        "on_startup": [_prepare_database, _initialize_vector_store, _log_routes],
+        "on_startup": [_prepare_database, _initialize_vector_store, _warm_embedding_model, _log_routes],
         "cors_config": cors_config,
         "debug": settings.debug,
         "openapi_config": OpenAPIConfig(title=settings.app_name, version="1.0.0"),
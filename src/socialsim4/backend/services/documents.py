@@ -11,6 +11,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -276,7 +277,7 @@ def retrieve_from_documents(
             })
 
     # Sort by similarity descending and take top_k
-    results.sort(key=lambda x: x["similarity"], reverse=True)
+    results.sort(key=itemgetter("similarity"), reverse=True)
     return results[:top_k]
 
 
@@ -323,7 +324,7 @@ def retrieve_from_global_knowledge(
                 })
 
     # Sort by similarity descending and take top_k
-    results.sort(key=lambda x: x["similarity"], reverse=True)
+    results.sort(key=itemgetter("similarity"), reverse=True)
     return results[:top_k]
 
 
@@ -63,6 +63,7 @@ async def get_simulation_state(simulation_id: str, db, user_id: int) -> Optional
     # Read environment_enabled from database scene_config (source of truth for toggle state)
     scene_config = sim.scene_config or {}
     environment_enabled = bool(scene_config.get("environment_enabled", False))
+    agent_count = len((sim.agent_config or {}).get("agents", []))
 
     # Get current tree record from SimTree registry
     record = SIM_TREE_REGISTRY.get(simulation_id)
@@ -73,23 +74,24 @@ async def get_simulation_state(simulation_id: str, db, user_id: int) -> Optional
             "config": EnvironmentConfig(enabled=environment_enabled).serialize(),
             "_suggestions_viewed_intervals": set(),
             "clients": None,
+            "agent_count": agent_count,
         }
 
     # Get current node simulator
     tree = record.tree
 
     # Try to get the leaf node (most recent state)
-    leaves = tree.leaves()
-    if not leaves:
+    current_node_id = min(tree.iter_leaves(), default=None)
+    if current_node_id is None:
         logger.warning(f"No leaf nodes found for simulation {simulation_id}")
         return {
             "turns": 0,
             "config": EnvironmentConfig(enabled=environment_enabled).serialize(),
             "_suggestions_viewed_intervals": set(),
             "clients": None,
+            "agent_count": agent_count,
         }
 
-    current_node_id = leaves[0]
     current_node = tree.nodes.get(current_node_id)
     if not current_node:
         logger.warning(f"Current node {current_node_id} not found in tree")
@@ -98,6 +100,7 @@ async def get_simulation_state(simulation_id: str, db, user_id: int) -> Optional
             "config": EnvironmentConfig(enabled=environment_enabled).serialize(),
             "_suggestions_viewed_intervals": set(),
             "clients": None,
+            "agent_count": agent_count,
         }
 
     simulator = current_node.get("sim")
@@ -108,6 +111,7 @@ async def get_simulation_state(simulation_id: str, db, user_id: int) -> Optional
             "config": EnvironmentConfig(enabled=environment_enabled).serialize(),
             "_suggestions_viewed_intervals": set(),
             "clients": None,
+            "agent_count": agent_count,
         }
 
     # Update simulator's config to match database (sync toggle state)
@@ -122,6 +126,7 @@ async def get_simulation_state(simulation_id: str, db, user_id: int) -> Optional
         "clients": simulator.clients,
         "node_id": current_node_id,
         "tree": tree,
+        "agent_count": agent_count,
     }
 
 
@@ -144,21 +149,11 @@ async def generate_environment_suggestions(
     if not clients:
         raise ValueError("No LLM provider configured")
 
-    # Get recent events from simulation logs
-    result = await db.execute(
-        select(Simulation).where(
-            Simulation.id == simulation_id.upper(),
-            Simulation.owner_id == user_id,
-        )
-    )
-    sim = result.scalar_one_or_none()
-    if not sim:
-        raise ValueError("Simulation not found")
-
-    # For now, build minimal context from state
+    # For now, build minimal context from state; the agent count was read
+    # alongside the simulation row, so there is no need to fetch it again
     context = {
         "recent_events": [],
-        "agent_count": len(sim.agent_config.get("agents", [])),
+        "agent_count": state["agent_count"],
         "current_turn": state["turns"],
         "scene_time": 540,  # Default, would come from actual scene state
     }
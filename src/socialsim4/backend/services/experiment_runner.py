@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import Counter, defaultdict
 from typing import Dict, List
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -27,10 +28,10 @@ async def create_experiment_db(simulation_id: str, base_node: int, name: str, de
         exp = Experiment(id=exp_id, simulation_id=simulation_id.upper(), base_node=int(base_node), name=name or exp_id, description=description or "", model_meta={})
         session.add(exp)
         await session.flush()
-        for v in variants:
-            ops = v.get("ops") or []
-            ev = ExperimentVariant(experiment_id=exp.id, name=v.get("name") or "variant", ops=ops)
-            session.add(ev)
+        session.add_all(
+            ExperimentVariant(experiment_id=exp.id, name=v.get("name") or "variant", ops=v.get("ops") or [])
+            for v in variants
+        )
         await session.commit()
         return exp_id
 
@@ -95,18 +96,11 @@ async def run_experiment_db(simulation_id: str, exp_id: str, turns: int) -> List
             agents = {}
             for name, ag in (sim.agents.items() if sim else []):
                 agents[name] = getattr(ag, "properties", {})
-            summaries[int(nid)] = {
-                "node_id": int(nid),
-                "turns": getattr(sim, "turns", 0) if sim else 0,
-                "agents": agents,
-                "sample_events": logs[-200:],
-            }
+            evs = logs[-200:]
 
-        # compute lightweight aggregated metrics per node
-        for nid, s in list(summaries.items()):
-            evs = s.get("sample_events", []) or []
-            votes = {}
-            emotion_series = {}
+            # compute lightweight aggregated metrics in the same pass
+            votes: Counter = Counter()
+            emotion_series: defaultdict = defaultdict(list)
             for ev in evs:
                 etype = ev.get("type") or ev.get("event_type")
                 data = ev.get("data") or {}
@@ -114,13 +108,19 @@ async def run_experiment_db(simulation_id: str, exp_id: str, turns: int) -> List
                     action = (data.get("action") or {}).get("action") if isinstance(data.get("action"), dict) else data.get("action")
                     if action == "vote" or data.get("vote") or data.get("candidate"):
                         cand = data.get("candidate") or data.get("vote") or str(data.get("choice") or "unknown")
-                        votes[cand] = votes.get(cand, 0) + 1
+                        votes[cand] += 1
                 if etype == "emotion_update" or data.get("emotion"):
                     actor = data.get("actor") or data.get("agent") or ev.get("agent")
                     if actor:
-                        emotion_series.setdefault(actor, []).append({"t": ev.get("timestamp"), "emotion": data.get("emotion") or data.get("value")})
+                        emotion_series[actor].append({"t": ev.get("timestamp"), "emotion": data.get("emotion") or data.get("value")})
 
-            s["metrics"] = {"voting_distribution": votes, "emotion_series": emotion_series}
+            summaries[int(nid)] = {
+                "node_id": int(nid),
+                "turns": getattr(sim, "turns", 0) if sim else 0,
+                "agents": agents,
+                "sample_events": evs,
+                "metrics": {"voting_distribution": dict(votes), "emotion_series": dict(emotion_series)},
+            }
 
         # update run record
         run.status = "finished"
@@ -138,18 +138,18 @@ class ExperimentRegistry:
     async def create_experiment(self, simulation_id: str, exp: dict) -> str:
         async with self._lock:
             sid = simulation_id.upper()
-            self._data.setdefault(sid, {})
             exp_id = f"exp-{int(time.time() * 1000)}"
             exp_record = dict(exp)
             exp_record.update({"id": exp_id, "created_at": time.time(), "status": "created"})
-            self._data[sid][exp_id] = exp_record
+            self._data.setdefault(sid, {})[exp_id] = exp_record
             return exp_id
 
     async def set_experiment(self, simulation_id: str, exp_id: str, value: dict) -> None:
         async with self._lock:
             sid = simulation_id.upper()
-            if sid in self._data and exp_id in self._data[sid]:
-                self._data[sid][exp_id].update(value)
+            record = self._data.get(sid, {}).get(exp_id)
+            if record is not None:
+                record.update(value)
 
     async def get_experiment(self, simulation_id: str, exp_id: str) -> dict | None:
         sid = simulation_id.upper()
@@ -182,34 +182,33 @@ async def create_and_branch(simulation_id: str, base_node: int, variants: List[d
     return mapping
 
 
-async def run_variants_parallel(simulation_id: str, node_ids: List[int], turns: int) -> List[int]:
-    """Run given node_ids in parallel by invoking their simulator.run in threads.
-
-    Returns list of node ids that finished.
-    """
+def _variant_record(simulation_id: str, node_ids: List[int]) -> SimTreeRecord:
     rec: SimTreeRecord = SIM_TREE_REGISTRY.get(simulation_id.upper())
     if rec is None:
         raise RuntimeError("Simulation tree not loaded")
-    tree = rec.tree
-    loop = asyncio.get_running_loop()
-
     # mark running
     for nid in node_ids:
         rec.running.add(int(nid))
+    return rec
 
-    async def _run(nid: int) -> int:
-        sim = tree.nodes[int(nid)]["sim"]
+
+async def _run_variant(rec: SimTreeRecord, nid: int, turns: int) -> int:
+    try:
+        sim = rec.tree.nodes[int(nid)]["sim"]
         await asyncio.to_thread(sim.run, int(turns))
-        return int(nid)
+    finally:
+        rec.running.discard(int(nid))
+    return int(nid)
 
-    tasks = [_run(n) for n in node_ids]
-    finished = await asyncio.gather(*tasks)
 
-    for nid in finished:
-        if int(nid) in rec.running:
-            rec.running.remove(int(nid))
+async def run_variants_parallel(simulation_id: str, node_ids: List[int], turns: int) -> List[int]:
+    """Run given node_ids in parallel by invoking their simulator.run in threads.
 
-    return finished
+    Each node leaves rec.running as soon as its own run finishes or fails.
+    Returns list of node ids that finished, in input order.
+    """
+    rec = _variant_record(simulation_id, node_ids)
+    return list(await asyncio.gather(*[_run_variant(rec, n, turns) for n in node_ids]))
 
 
 # In-memory map to track running ExperimentRun tasks: run_id -> asyncio.Task
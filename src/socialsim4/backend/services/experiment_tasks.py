@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import concurrent.futures
 import json
+from collections import Counter, defaultdict
 from typing import List
 
 from socialsim4.backend.celery_app import celery_app
@@ -128,12 +129,14 @@ def run_experiment_task(self, simulation_id: str, exp_id: str, run_id: int, turn
                 sim.run(int(turns))
                 return int(nid)
 
-            finished = []
+            # Preallocated and filled by submission index so finished_nodes keeps
+            # variant order regardless of which branch completes first
+            finished = [None] * len(node_ids)
             with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, max(1, len(node_ids)))) as ex:
-                futs = [ex.submit(run_sim, nid) for nid in node_ids]
+                futs = {ex.submit(run_sim, nid): i for i, nid in enumerate(node_ids)}
                 for f in concurrent.futures.as_completed(futs):
                     try:
-                        finished.append(f.result())
+                        finished[futs[f]] = f.result()
                     except Exception as e:
                         # mark error and continue
                         async with get_session() as s2:
@@ -155,19 +158,12 @@ def run_experiment_task(self, simulation_id: str, exp_id: str, run_id: int, turn
                 agents = {}
                 for name, ag in (sim.agents.items() if sim else []):
                     agents[name] = getattr(ag, "properties", {})
-                summaries[int(nid)] = {
-                    "node_id": int(nid),
-                    "turns": getattr(sim, "turns", 0) if sim else 0,
-                    "agents": agents,
-                    "sample_events": logs[-200:],
-                }
-            # compute lightweight aggregated metrics for each summary
-            for nid, s in summaries.items():
-                evs = s.get("sample_events", []) or []
+                evs = logs[-200:]
+                # compute lightweight aggregated metrics in the same pass
                 # voting distribution
-                votes = {}
+                votes: Counter = Counter()
                 # emotion time series per agent
-                emotion_series = {}
+                emotion_series: defaultdict = defaultdict(list)
                 for ev in evs:
                     etype = ev.get("type") or ev.get("event_type")
                     data = ev.get("data") or {}
@@ -176,16 +172,22 @@ def run_experiment_task(self, simulation_id: str, exp_id: str, run_id: int, turn
                         action = (data.get("action") or {}).get("action") if isinstance(data.get("action"), dict) else data.get("action")
                         if action == "vote" or data.get("vote") or data.get("candidate"):
                             cand = data.get("candidate") or data.get("vote") or str(data.get("choice") or "unknown")
-                            votes[cand] = votes.get(cand, 0) + 1
+                            votes[cand] += 1
                     # emotion updates
                     if etype == "emotion_update" or data.get("emotion"):
                         actor = data.get("actor") or data.get("agent") or ev.get("agent")
                         if actor:
-                            emotion_series.setdefault(actor, []).append({"t": ev.get("timestamp"), "emotion": data.get("emotion") or data.get("value")})
+                            emotion_series[actor].append({"t": ev.get("timestamp"), "emotion": data.get("emotion") or data.get("value")})
 
-                s["metrics"] = {
-                    "voting_distribution": votes,
-                    "emotion_series": emotion_series,
+                summaries[int(nid)] = {
+                    "node_id": int(nid),
+                    "turns": getattr(sim, "turns", 0) if sim else 0,
+                    "agents": agents,
+                    "sample_events": evs,
+                    "metrics": {
+                        "voting_distribution": dict(votes),
+                        "emotion_series": dict(emotion_series),
+                    },
                 }
 
             async with get_session() as session2:
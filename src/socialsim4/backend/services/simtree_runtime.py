@@ -211,6 +211,10 @@ def _build_tree_for_sim(sim_record, clients: dict | None = None) -> SimTree:
     # Build agents from agent_config
     built_agents = []
     emotion_enabled = cfg["emotion_enabled"] if ("emotion_enabled" in cfg) else False
+    # scene common actions from registry (fallback to scene introspection)
+    # Use normalized scene_key so short names (e.g., 'village') map correctly.
+    # Same for every agent, so resolve once outside the loop.
+    basic_names = SCENE_ACTIONS.get(scene_key, {}).get("basic", ())
     for cfg_agent in items:
         aname = str(cfg_agent.get("name") or "").strip() or "Agent"
         profile = str(cfg_agent.get("profile") or "")
@@ -219,14 +223,10 @@ def _build_tree_for_sim(sim_record, clients: dict | None = None) -> SimTree:
         if "emotion_enabled" not in props:
             props["emotion_enabled"] = emotion_enabled
         language = _normalize_language(cfg_agent.get("language") or preferred_language)
-        # scene common actions from registry (fallback to scene introspection)
-        # Use normalized scene_key so short names (e.g., 'village') map correctly.
-        reg = SCENE_ACTIONS.get(scene_key, {})
-        basic_names = list(reg.get("basic", []))
 
         seen = set()
         merged_names = []
-        for n in basic_names + selected:
+        for n in (*basic_names, *selected):
             if n and n not in seen:
                 seen.add(n)
                 merged_names.append(n)
@@ -21,21 +21,18 @@ def run_sync_task(self, simulation_id: Optional[str], user_id: Optional[int], pa
             sync_log = None
             if sync_log_id is not None:
                 sync_log = await session.get(SimulationSyncLog, sync_log_id)
-            # helper to append message
-            async def append(msg: str):
-                nonlocal sync_log
+            # helper to append message; messages ride along with the next
+            # commit instead of flushing an UPDATE per line (a flush is not
+            # visible to other sessions before the commit anyway)
+            def append(msg: str):
                 if sync_log is None:
                     return
-                det = sync_log.details or []
-                det.append(str(msg))
-                sync_log.details = det
-                await session.flush()
+                sync_log.details = [*(sync_log.details or []), str(msg)]
 
             try:
                 if sync_log:
                     sync_log.status = 'started'
-                    await session.flush()
-                    await append('[START] Task started')
+                    append('[START] Task started')
                 # Normalize payload
                 scene_type = payload.get('scene_type') or payload.get('sceneType') or 'unknown'
                 scene_config = payload.get('scene_config') or payload.get('sceneConfig') or {}
@@ -62,7 +59,7 @@ def run_sync_task(self, simulation_id: Optional[str], user_id: Optional[int], pa
                     await session.commit()
                     await session.refresh(sim)
                     if sync_log:
-                        await append(f"[OK] Created simulation id={sim.id}")
+                        append(f"[OK] Created simulation id={sim.id}")
                 else:
                     # update existing
                     sim.name = payload.get('name') or sim.name
@@ -72,17 +69,17 @@ def run_sync_task(self, simulation_id: Optional[str], user_id: Optional[int], pa
                     sim.latest_state = payload.get('latest_state') or sim.latest_state
                     await session.commit()
                     if sync_log:
-                        await append(f"[OK] Updated simulation id={sim.id}")
+                        append(f"[OK] Updated simulation id={sim.id}")
 
                 if sync_log:
                     sync_log.status = 'finished'
-                    await append('[DONE] Task finished')
+                    append('[DONE] Task finished')
                     await session.commit()
                 return {"simulation_id": sim.id}
             except Exception as e:
                 if sync_log:
                     sync_log.status = 'error'
-                    await append(f"[ERROR] {str(e)}")
+                    append(f"[ERROR] {str(e)}")
                     await session.commit()
                 raise
 
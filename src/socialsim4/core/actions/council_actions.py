@@ -5,6 +5,8 @@ Uses the SystemFacilitator for permission checks instead of role-based restricti
 Any agent can initiate facilitation actions when in the appropriate phase.
 """
 
+from collections import Counter
+
 from socialsim4.core.action import Action
 from socialsim4.core.action_controller import ActionConstraints
 from socialsim4.core.event import MessageEvent, PublicEvent
@@ -77,9 +79,8 @@ class VotingStatusAction(Action):
             summary = "Voting not started"
             return True, result, summary, {}, False
 
-        yes = sum(v == "yes" for v in votes.values())
-        no = sum(v == "no" for v in votes.values())
-        abstain = sum(v == "abstain" for v in votes.values())
+        tally = Counter(votes.values())
+        yes, no, abstain = tally["yes"], tally["no"], tally["abstain"]
         pending_names = [
             name for name in all_agents if name not in votes
         ]
@@ -222,9 +223,8 @@ class VoteAction(Action, ActionConstraints):
             and len(votes) >= num_members
             and not scene.state.get("voting_completed_announced", False)
         ):
-            yes = sum(v == "yes" for v in votes.values())
-            no = sum(v == "no" for v in votes.values())
-            abstain = sum(v == "abstain" for v in votes.values())
+            tally = Counter(votes.values())
+            yes, no, abstain = tally["yes"], tally["no"], tally["abstain"]
             result_text = "passed" if yes > num_members / 2 else "failed"
             simulator.broadcast(
                 PublicEvent(
@@ -76,8 +76,9 @@ class ListKnowledgeAction(Action):
         for i, item in enumerate(items, 1):
             title = item.get("title", "Untitled")
             kb_type = item.get("type", "text")
-            content_preview = str(item.get("content", ""))[:100]
-            if len(str(item.get("content", ""))) > 100:
+            content = str(item.get("content", ""))
+            content_preview = content[:100]
+            if len(content) > 100:
                 content_preview += "..."
             lines.append(f"[{i}] ({kb_type}) {title}: {content_preview}")
 
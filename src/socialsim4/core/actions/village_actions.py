@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from socialsim4.core.action import Action
 from socialsim4.core.agent import Agent
 from socialsim4.core.scene import Scene
@@ -185,7 +187,7 @@ class LookAroundAction(Action):
             if dist <= radius:
                 nearby_agents.append((dist, other.name))
         if nearby_agents:
-            nearby_agents.sort(key=lambda x: x[0])
+            nearby_agents.sort(key=itemgetter(0))
             agents_str = ", ".join(
                 [
                     _localized(agent, f"{name}({dist})", f"{name}(距离 {dist})")
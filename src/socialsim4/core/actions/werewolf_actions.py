@@ -51,7 +51,8 @@ class VoteLynchAction(Action):
 
         votes = scene.state.setdefault("lynch_votes", {})
         votes[agent.name] = target
-        tally = sum(1 for v, t in votes.items() if t == target and _is_alive(scene, v))
+        alive = set(scene.state.get("alive", []))
+        tally = sum(1 for v, t in votes.items() if t == target and v in alive)
         simulator.broadcast(PublicEvent(f"{agent.name} voted to lynch {target}."))
         result = {"target": target, "tally": tally}
         summary = f"{agent.name} voted to lynch {target}"
@@ -109,10 +110,11 @@ class NightKillAction(Action):
             receivers=receivers,
         )
         # Tally only werewolf votes
+        alive = set(scene.state.get("alive", []))
         tally = sum(
             1
             for v, t in votes.items()
-            if t == target and _is_alive(scene, v) and _role_of(scene, v) == "werewolf"
+            if t == target and v in alive and _role_of(scene, v) == "werewolf"
         )
         result = {"target": target, "tally": tally}
         summary = f"{agent.name} voted night kill: {target}"
@@ -40,6 +40,42 @@ from .serialization import serialize_agent, deserialize_agent
 logger = logging.getLogger(__name__)
 
 
+# Output format instructions appended to every system prompt; they only vary
+# with emotion_enabled, so both variants are built once at import
+_OUTPUT_FORMAT = """--- Thoughts ---
+[What you're thinking right now - brief]
+
+--- Plan ---
+Goals: [your goals]
+Milestones: [completed ✓, pending →]
+
+--- Action ---
+<Action name="[action_name]">
+  [params if needed]
+</Action>
+
+Example:
+--- Thoughts ---
+Need to gather food.
+
+--- Plan ---
+Goals: Collect dinner
+Milestones: ✓ at market, → gather food
+
+--- Action ---
+<Action name="gather_resource"><resource>food</resource></Action>
+"""
+
+_OUTPUT_FORMAT_WITH_EMOTION = _OUTPUT_FORMAT + """
+
+--- Emotion Update ---
+// Mandatory: Output your emotion after each turn
+// Use Plutchik emotions: Joy, Trust, Fear, Surprise, Sadness, Disgust, Anger, Anticipation
+// Base on: goal progress (+→ Joy/Trust, -→ Sadness/Fear), novelty (→ Surprise), conflict (→ Anger/Disgust)
+<Emotion>[emotion]</Emotion>
+"""
+
+
 class Agent:
     """
     Autonomous agent for social simulations.
@@ -104,6 +140,12 @@ class Agent:
         )
         self.is_offline = False
 
+        # (action_space snapshot, catalog, instructions) reused across turns
+        self._action_prompt_cache = None
+
+        # id(knowledge item) -> (title, content, derived terms) for query_knowledge
+        self._knowledge_terms_cache = {}
+
     # -------------------------------------------------------------------------
     # System Prompt & Output Format
     # -------------------------------------------------------------------------
@@ -160,24 +202,13 @@ Internal Notes:
             plan_state_block += "\nPlan State is empty. In this turn, include a plan update block using tags to initialize numbered Goals and Milestones.\n"
 
         # Build action catalog and usage instructions
-        action_catalog = "\n".join([
-            f"- {getattr(action, 'NAME', '')}: {getattr(action, 'DESC', '')}".strip()
-            for action in self.action_space
-        ])
-        action_instructions = "".join(
-            getattr(action, "INSTRUCTION", "") for action in self.action_space
-        )
+        action_catalog, action_instructions = self._action_prompt_blocks()
 
         # Examples block from scene
         examples_block = ""
-        if scene and hasattr(scene, 'get_examples') and scene.get_examples():
-            examples_block = f"Here are some examples:\n{scene.get_examples()}"
-
-        # Emotion prompt
-        emotion_prompt = (
-            f"Your current emotion is {self.emotion}."
-            if self.emotion_enabled else ""
-        )
+        examples = scene.get_examples() if scene and hasattr(scene, 'get_examples') else ""
+        if examples:
+            examples_block = f"Here are some examples:\n{examples}"
 
         # Knowledge base preview
         knowledge_block = ""
@@ -187,8 +218,9 @@ Internal Notes:
             kb_preview = []
             for i, item in enumerate(enabled_kb[:5], 1):
                 title = item.get("title", "Untitled")
-                content_preview = str(item.get("content", ""))[:80]
-                if len(str(item.get("content", ""))) > 80:
+                content = str(item.get("content", ""))
+                content_preview = content[:80]
+                if len(content) > 80:
                     content_preview += "..."
                 kb_preview.append(f"  [{i}] {title}: {content_preview}")
             kb_list = "\n".join(kb_preview)
@@ -236,42 +268,27 @@ Usage:
 """
         return base
 
+    def _action_prompt_blocks(self):
+        """Return (catalog, instructions) for the action space, rebuilt only when it changes."""
+        key = tuple(self.action_space)
+        cached = self._action_prompt_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        action_catalog = "\n".join([
+            f"- {getattr(action, 'NAME', '')}: {getattr(action, 'DESC', '')}".strip()
+            for action in key
+        ])
+        action_instructions = "".join(
+            getattr(action, "INSTRUCTION", "") for action in key
+        )
+        self._action_prompt_cache = (key, action_catalog, action_instructions)
+        return action_catalog, action_instructions
+
     def get_output_format(self):
         """Get the output format specification for the agent."""
-        base_prompt = """--- Thoughts ---
-[What you're thinking right now - brief]
-
---- Plan ---
-Goals: [your goals]
-Milestones: [completed ✓, pending →]
-
---- Action ---
-<Action name="[action_name]">
-  [params if needed]
-</Action>
-
-Example:
---- Thoughts ---
-Need to gather food.
-
---- Plan ---
-Goals: Collect dinner
-Milestones: ✓ at market, → gather food
-
---- Action ---
-<Action name="gather_resource"><resource>food</resource></Action>
-"""
         if self.emotion_enabled:
-            emotion_rules = """
-
---- Emotion Update ---
-// Mandatory: Output your emotion after each turn
-// Use Plutchik emotions: Joy, Trust, Fear, Surprise, Sadness, Disgust, Anger, Anticipation
-// Base on: goal progress (+→ Joy/Trust, -→ Sadness/Fear), novelty (→ Surprise), conflict (→ Anger/Disgust)
-<Emotion>[emotion]</Emotion>
-"""
-            return base_prompt + emotion_rules
-        return base_prompt
+            return _OUTPUT_FORMAT_WITH_EMOTION
+        return _OUTPUT_FORMAT
 
     # -------------------------------------------------------------------------
     # LLM Interaction
@@ -305,11 +322,8 @@ History:
         summary_output = self.call_llm(client, messages)
 
         # Extract summary
-        summary_match = re.search(r"Summary: (.*)", summary_output, re.DOTALL)
-        if summary_match:
-            summary = summary_match.group(1).strip()
-        else:
-            summary = summary_output
+        _, found, summary_text = summary_output.partition("Summary: ")
+        summary = summary_text.strip() if found else summary_output
 
         # Replace history with summary
         self.short_memory.clear()
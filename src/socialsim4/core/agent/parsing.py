@@ -15,6 +15,52 @@ Contains:
 import re
 import xml.etree.ElementTree as ET
 
+# (required header literals, pattern) for each section returned by
+# parse_full_response, in return order
+_SECTION_SPECS = (
+    (
+        ("--- Thoughts ---", "--- Plan ---"),
+        re.compile(r"--- Thoughts ---\s*(.*?)\s*--- Plan ---", re.DOTALL),
+    ),
+    (
+        ("--- Plan ---", "--- Action ---"),
+        re.compile(r"--- Plan ---\s*(.*?)\s*--- Action ---", re.DOTALL),
+    ),
+    (
+        ("--- Action ---",),
+        re.compile(r"--- Action ---\s*(.*?)(?:\n--- Plan Update ---|\Z)", re.DOTALL),
+    ),
+    (
+        ("--- Plan Update ---",),
+        re.compile(r"--- Plan Update ---\s*(.*?)(?:\n--- Emotion Update ---|\Z)", re.DOTALL),
+    ),
+    (
+        ("--- Emotion Update ---",),
+        re.compile(r"--- Emotion Update ---\s*(.*)$", re.DOTALL),
+    ),
+)
+
+_NUMBERED_LINE_RE = re.compile(r"^(\d+)\.\s*(.*)$")
+# Bare ampersands (not already part of an entity) that would break ET parsing
+_BARE_AMP_RE = re.compile(r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]*;)")
+# <Action ...>...</Action>, else a self-closing <Action .../>. Whenever the
+# element form matches anywhere it also matches at the leftmost position the
+# self-closing form could, so one alternation gives the same result as
+# searching for each form in turn.
+_ACTION_RE = re.compile(
+    r"""
+    <Action.*?>.*</Action>   # element with a closing tag
+    | <Action.*?/>           # self-closing element
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+# Parameterless actions (<Action name="yield"/>, <Action name="yield"></Action>)
+# make up most turns; the name charset excludes anything ET would unescape or
+# normalize, so these skip building an element tree entirely
+_BARE_ACTION_RE = re.compile(
+    r'<Action\s+name="([^"<>&\t\n\r]+)"\s*(?:/>|>\s*</Action>)'
+)
+
 
 def parse_full_response(full_response: str) -> tuple:
     """
@@ -34,39 +80,15 @@ def parse_full_response(full_response: str) -> tuple:
         Tuple of (thoughts, plan, action, plan_update_block, emotion_update_block)
         Each element is a string, empty if section not found
     """
-    thoughts_match = re.search(
-        r"--- Thoughts ---\s*(.*?)\s*--- Plan ---",
-        full_response,
-        re.DOTALL
-    )
-    plan_match = re.search(
-        r"--- Plan ---\s*(.*?)\s*--- Action ---",
-        full_response,
-        re.DOTALL
-    )
-    action_match = re.search(
-        r"--- Action ---\s*(.*?)(?:\n--- Plan Update ---|\Z)",
-        full_response,
-        re.DOTALL
-    )
-    plan_update_match = re.search(
-        r"--- Plan Update ---\s*(.*?)(?:\n--- Emotion Update ---|\Z)",
-        full_response,
-        re.DOTALL
-    )
-    emotion_update_match = re.search(
-        r"--- Emotion Update ---\s*(.*)$",
-        full_response,
-        re.DOTALL
-    )
-
-    thoughts = thoughts_match.group(1).strip() if thoughts_match else ""
-    plan = plan_match.group(1).strip() if plan_match else ""
-    action = action_match.group(1).strip() if action_match else ""
-    plan_update_block = plan_update_match.group(1).strip() if plan_update_match else ""
-    emotion_update_block = emotion_update_match.group(1).strip() if emotion_update_match else ""
-
-    return thoughts, plan, action, plan_update_block, emotion_update_block
+    # Every section regex needs its header literals; check them with plain
+    # substring tests first so absent sections cost no regex scan at all
+    sections = []
+    for headers, pattern in _SECTION_SPECS:
+        m = None
+        if all(h in full_response for h in headers):
+            m = pattern.search(full_response)
+        sections.append(m.group(1).strip() if m else "")
+    return tuple(sections)
 
 
 def parse_emotion_update(block: str) -> str | None:
@@ -112,7 +134,7 @@ def _parse_numbered_lines(txt: str) -> list:
     items = []
     lines = [l.strip() for l in (txt or "").splitlines() if l.strip()]
     for l in lines:
-        m = re.match(r"^(\d+)\.\s*(.*)$", l)
+        m = _NUMBERED_LINE_RE.match(l)
         if not m:
             raise ValueError("Malformed Plan Update list line: " + l)
         items.append(m.group(2).strip())
@@ -162,11 +184,7 @@ def parse_plan_update(block: str) -> dict | None:
 
     xml_text = "<Update>" + text + "</Update>"
     # Normalize bare ampersands so XML parser won't choke
-    xml_text = re.sub(
-        r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]*;)",
-        "&amp;",
-        xml_text,
-    )
+    xml_text = _BARE_AMP_RE.sub("&amp;", xml_text)
 
     root = ET.fromstring(xml_text)
     if root.tag != "Update":
@@ -261,36 +279,25 @@ def parse_actions(action_block: str) -> list:
         >>> result[0]['param']
         'value'
     """
-    if not action_block:
+    # A plain substring check rules out tag-free blocks without starting the
+    # regex engine
+    if not action_block or "<Action" not in action_block:
         return []
 
-    text = action_block.strip()
-
-    # Find Action tags
-    m1 = re.search(r"<Action.*?>.*</Action>", text, re.DOTALL)
-    m2 = re.search(r"<Action.*?/>", text, re.DOTALL)
-    m = m1 or m2
-
-    if m:
-        text = m.group(0).strip()
-    else:
+    # Find Action tags. The match always starts with "<Action" and ends with
+    # ">", so surrounding whitespace and code fences are already excluded and
+    # need no separate stripping passes.
+    m = _ACTION_RE.search(action_block)
+    if not m:
         return []
+    text = m.group(0)
 
-    # Strip code fences
-    if text.startswith("```xml") and text.endswith("```"):
-        text = text[6:-3].strip()
-    elif text.startswith("```") and text.endswith("```"):
-        text = text[3:-3].strip()
-    elif text.startswith("`") and text.endswith("`"):
-        text = text.strip("`")
-    text = text.strip("`")
+    bare = _BARE_ACTION_RE.fullmatch(text)
+    if bare:
+        return [{"action": bare.group(1)}]
 
     # Normalize bare ampersands
-    text = re.sub(
-        r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]*;)",
-        "&amp;",
-        text,
-    )
+    text = _BARE_AMP_RE.sub("&amp;", text)
 
     # Parse Action element
     try:
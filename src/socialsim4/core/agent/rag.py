@@ -18,6 +18,7 @@ Contains:
 """
 
 import logging
+from operator import itemgetter
 from typing import Any
 
 
@@ -64,6 +65,18 @@ def get_enabled_knowledge(agent) -> list:
     return [k for k in agent.knowledge_base if k.get("enabled", True)]
 
 
+def _knowledge_terms(title: str, content: str) -> tuple:
+    """
+    Lowercased text and word sets for one knowledge item.
+
+    Returns:
+        (title, combined, title_words, combined_words)
+    """
+    title = title.lower()
+    combined = f"{title} {content.lower()}"
+    return title, combined, frozenset(title.split()), frozenset(combined.split())
+
+
 def query_knowledge(agent, query: str, max_results: int = 3) -> list:
     """
     Simple keyword-based retrieval from the knowledge base.
@@ -85,16 +98,24 @@ def query_knowledge(agent, query: str, max_results: int = 3) -> list:
     query_lower = query.lower()
     query_words = set(query_lower.split())
 
+    # Knowledge items rarely change between queries, so the derived terms are
+    # kept per agent, keyed by item identity and checked against the item's
+    # current title and content. The cache is rebuilt from the items seen in
+    # this query, so removed items drop out and it goes away with the agent.
+    old_cache = agent._knowledge_terms_cache
+    cache = {}
+
     scored = []
     for item in get_enabled_knowledge(agent):
-        title = str(item.get("title", "")).lower()
-        content = str(item.get("content", "")).lower()
-        combined = f"{title} {content}"
+        raw_title = str(item.get("title", ""))
+        raw_content = str(item.get("content", ""))
+        entry = old_cache.get(id(item))
+        if entry is None or entry[0] != raw_title or entry[1] != raw_content:
+            entry = (raw_title, raw_content, _knowledge_terms(raw_title, raw_content))
+        cache[id(item)] = entry
+        title, combined, title_words, combined_words = entry[2]
 
         # Simple scoring: count matching words + boost for title matches
-        combined_words = set(combined.split())
-        title_words = set(title.split())
-
         word_matches = len(query_words & combined_words)
         title_matches = len(query_words & title_words)
 
@@ -110,9 +131,10 @@ def query_knowledge(agent, query: str, max_results: int = 3) -> list:
 
         if score > 0:
             scored.append((score, item))
+    agent._knowledge_terms_cache = cache
 
     # Sort by score descending
-    scored.sort(key=lambda x: x[0], reverse=True)
+    scored.sort(key=itemgetter(0), reverse=True)
     return [item for score, item in scored[:max_results]]
 
 
@@ -208,7 +230,7 @@ def retrieve_from_documents(agent, query_embedding: list, top_k: int = 5) -> lis
                 "similarity": similarity,
             })
 
-    results.sort(key=lambda x: x["similarity"], reverse=True)
+    results.sort(key=itemgetter("similarity"), reverse=True)
     return results[:top_k]
 
 
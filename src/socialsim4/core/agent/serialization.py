@@ -9,10 +9,11 @@ Contains:
     - deserialize_agent: Create agent from serialized dict
 """
 
-import json
 import logging
+import sys
 
 from socialsim4.core.config import MAX_REPEAT
+from socialsim4.core.jsonutil import json_copy
 
 
 logger = logging.getLogger(__name__)
@@ -45,16 +46,16 @@ def serialize_agent(agent) -> dict:
     ]
 
     # Deep-copy properties
-    props = json.loads(json.dumps(agent.properties))
+    props = json_copy(agent.properties)
 
     # Deep-copy plan state
-    plan = json.loads(json.dumps(agent.plan_state))
+    plan = json_copy(agent.plan_state)
 
     # Deep-copy knowledge base
-    kb = json.loads(json.dumps(agent.knowledge_base))
+    kb = json_copy(agent.knowledge_base)
 
     # Deep-copy documents
-    docs = json.loads(json.dumps(agent.documents))
+    docs = json_copy(agent.documents)
 
     return {
         "name": agent.name,
@@ -105,7 +106,7 @@ def deserialize_agent(data: dict, event_handler=None, agent_class=None) -> objec
 
     # Deep-copy properties to avoid sharing
     raw_props = data.get("properties", {}) or {}
-    props = json.loads(json.dumps(raw_props))
+    props = json_copy(raw_props)
 
     # Handle emotion_enabled: check top-level data, then props, then default to False
     if "emotion_enabled" in data:
@@ -113,8 +114,15 @@ def deserialize_agent(data: dict, event_handler=None, agent_class=None) -> objec
     else:
         props.setdefault("emotion_enabled", False)
 
+    # Names key most per-simulation dicts (agents, roles, votes); interning
+    # makes those lookups identity hits across restored snapshots. Malformed or
+    # legacy snapshots may carry a non-str name, which is passed through as-is.
+    name = data["name"]
+    if isinstance(name, str):
+        name = sys.intern(name)
+
     agent = agent_class(
-        name=data["name"],
+        name=name,
         user_profile=data["user_profile"],
         style=data["style"],
         initial_instruction=data["initial_instruction"],
@@ -134,23 +142,28 @@ def deserialize_agent(data: dict, event_handler=None, agent_class=None) -> objec
     agent.emotion_enabled = bool(props.get("emotion_enabled", False))
 
     # Restore memory
-    agent.short_memory.history = json.loads(
-        json.dumps(data.get("short_memory", []))
-    )
+    history = json_copy(data.get("short_memory", []))
+    # Roles come from a tiny closed set but each restored entry carries its
+    # own copy; interning lets every message across agents share one string
+    for msg in history:
+        if not isinstance(msg, dict):
+            continue
+        role = msg.get("role")
+        if isinstance(role, str):
+            msg["role"] = sys.intern(role)
+    agent.short_memory.history = history
     agent.last_history_length = data.get("last_history_length", 0)
 
     # Restore plan state
-    agent.plan_state = json.loads(
-        json.dumps(
-            data.get(
-                "plan_state",
-                {
-                    "goals": [],
-                    "milestones": [],
-                    "strategy": "",
-                    "notes": "",
-                },
-            )
+    agent.plan_state = json_copy(
+        data.get(
+            "plan_state",
+            {
+                "goals": [],
+                "milestones": [],
+                "strategy": "",
+                "notes": "",
+            },
         )
     )
 
@@ -158,7 +171,7 @@ def deserialize_agent(data: dict, event_handler=None, agent_class=None) -> objec
     kb_data = data.get("knowledge_base", [])
     logger.debug(f"Agent.deserialize '{agent.name}': kb_data has {len(kb_data)} items")
     if kb_data:
-        agent.knowledge_base = json.loads(json.dumps(kb_data))
+        agent.knowledge_base = json_copy(kb_data)
         logger.debug(f"Agent.deserialize '{agent.name}': after copy, knowledge_base has {len(agent.knowledge_base)} items")
         for i, item in enumerate(agent.knowledge_base):
             logger.debug(
@@ -168,7 +181,7 @@ def deserialize_agent(data: dict, event_handler=None, agent_class=None) -> objec
     # Restore documents
     docs_data = data.get("documents", {})
     if docs_data:
-        agent.documents = json.loads(json.dumps(docs_data))
+        agent.documents = json_copy(docs_data)
         logger.debug(f"Agent.deserialize '{agent.name}': documents has {len(agent.documents)} items")
 
     # Restore LLM error state
@@ -1,7 +1,8 @@
-import json
 import logging
 from typing import Dict, List, Any, Optional
 
+from socialsim4.core.jsonutil import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +58,7 @@ JSON only, no explanation."""
                     response = response[4:]
             if not response.strip():
                 raise ValueError("Empty LLM response")
-            return json.loads(response.strip())
+            return json_loads(response.strip())
         except Exception as e:
             logger.exception("Failed to summarize context with LLM: %s", e)
             # Fallback to basic analysis
@@ -124,7 +125,7 @@ JSON only, no explanation."""
                     response = response[4:]
             if not response.strip():
                 raise ValueError("Empty LLM response after cleaning")
-            suggestions = json.loads(response.strip())
+            suggestions = json_loads(response.strip())
 
             # Validate and sanitize
             valid_severities = {"mild", "moderate", "severe"}
@@ -2,7 +2,7 @@ from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentConfig:
     """Configuration for the dynamic environment feature."""
 
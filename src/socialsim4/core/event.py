@@ -8,6 +8,12 @@ def _fmt_time_prefix(time_val):
 
 
 class Event:
+    # Events are created for every message/broadcast; slots keep the fixed
+    # fields out of a per-instance dict. code/params are attached by scenes
+    # after construction; "__dict__" stays for ad-hoc attributes and is only
+    # allocated when one is actually set.
+    __slots__ = ("code", "params", "__dict__")
+
     def to_string(self, time=None):
         raise NotImplementedError
 
@@ -16,6 +22,8 @@ class Event:
 
 
 class MessageEvent(Event):
+    __slots__ = ("sender", "message")
+
     def __init__(self, sender, message):
         self.sender = sender
         self.message = message
@@ -29,6 +37,8 @@ class MessageEvent(Event):
 
 
 class PublicEvent(Event):
+    __slots__ = ("content", "prefix", "images", "audio", "video")
+
     def __init__(self, content, prefix="Public Event", images=None, audio=None, video=None):
         self.content = content
         self.prefix = prefix
@@ -50,6 +60,8 @@ class PublicEvent(Event):
 
 
 class NewsEvent(Event):
+    __slots__ = ("content",)
+
     def __init__(self, content):
         self.content = content
 
@@ -59,6 +71,8 @@ class NewsEvent(Event):
 
 
 class StatusEvent(Event):
+    __slots__ = ("status_data",)
+
     def __init__(self, status_data):
         self.status_data = status_data
 
@@ -68,6 +82,8 @@ class StatusEvent(Event):
 
 
 class SpeakEvent(Event):
+    __slots__ = ("sender", "message")
+
     def __init__(self, sender, message):
         self.sender = sender
         self.message = message
@@ -82,6 +98,8 @@ class SpeakEvent(Event):
 
 
 class TalkToEvent(Event):
+    __slots__ = ("sender", "recipient", "message")
+
     def __init__(self, sender, recipient, message):
         self.sender = sender
         self.recipient = recipient
@@ -98,6 +116,8 @@ class TalkToEvent(Event):
 class EnvironmentEvent(Event):
     """Environmental events like weather, emergencies, notifications, public opinion."""
 
+    __slots__ = ("event_type", "description", "severity")
+
     def __init__(self, event_type: str, description: str, severity: str = "mild"):
         self.event_type = event_type  # "weather", "emergency", "notification", "opinion"
         self.description = description
@@ -0,0 +1,103 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+Contains:
+    - json_copy: Deep-copy plain JSON data via a serialize/parse round trip
+    - json_loads: Parse a JSON document (drop-in for json.loads)
+    - json_dumps: Serialize to a JSON string (drop-in for json.dumps)
+
+orjson is an optional dependency. Without it every helper falls back to the
+standard library json module with identical results for JSON-safe data.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_copy(obj: Any) -> Any:
+    """
+    Deep-copy JSON data (dicts, lists, str, numbers, bool, None).
+
+    Replaces json.loads(json.dumps(obj)), which the snapshot code uses to
+    guarantee copies share no references with the live objects. For plain
+    JSON data the result is the same. Under orjson, values outside plain JSON
+    behave differently from the stdlib round trip: NaN and Infinity become
+    None instead of being kept, and date/datetime, UUID, dataclass and Enum
+    values are converted to their JSON forms instead of raising TypeError.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Independent copy of obj
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits; let the stdlib decide
+            pass
+    return json.loads(json.dumps(obj))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when available.
+
+    Raises json.JSONDecodeError on invalid input just like json.loads
+    (orjson's error type is a subclass of it), so existing except clauses
+    keep working. Meant for LLM responses and template files.
+
+    Any input orjson rejects is handed to the stdlib, so documents json.loads
+    accepts (e.g. NaN/Infinity) still parse. Integers wider than 64 bits
+    are only exact on that fallback path: orjson versions that reject them
+    fall back, while recent ones parse them as floats.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN/Infinity, and in some versions
+            # oversized ints); let the stdlib accept the input or raise
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize obj to a JSON string, using orjson when available.
+
+    Used as the database engine's JSON column serializer, so snapshots and
+    logs are encoded in C rather than by the stdlib encoder. Output is compact
+    UTF-8 instead of ASCII-escaped, which decodes to the same values. As with
+    json_copy, orjson differs from json.dumps outside plain JSON: NaN and
+    Infinity are written as null, and date/datetime, UUID, dataclass and Enum
+    values are encoded instead of raising TypeError.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If obj contains values neither encoder can serialize
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits; let the stdlib encode or raise
+            pass
+    return json.dumps(obj)
@@ -18,13 +18,14 @@ Environment variables:
     LLM_MAX_RETRIES: Maximum retry attempts (default: 2)
     LLM_RETRY_BACKOFF_S: Initial retry backoff in seconds (default: 1.0)
     LLM_MAX_CONCURRENT_PER_CLIENT: Max concurrent requests (default: 8)
+    LLM_EXECUTOR_MAX_WORKERS: Threads shared by all clients for timed calls (default: 64)
 """
 
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutTimeout
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutTimeout, wait as futures_wait
 from copy import deepcopy
-from threading import BoundedSemaphore
+from threading import BoundedSemaphore, Event, Lock
 from typing import List, Dict, Any
 
 from .llm_config import LLMConfig
@@ -37,6 +38,12 @@ _openai = None
 _gemini = None
 _ollama = None
 
+# Shared worker pool for timed (non-OpenAI) calls, created on first use.
+# Simulation worker threads can make their first call concurrently, so creation
+# is guarded to build exactly one pool.
+_executor = None
+_executor_lock = Lock()
+
 
 def _get_openai():
     """Get OpenAI provider functions (lazy loaded)."""
@@ -62,6 +69,17 @@ def _get_ollama():
     return _ollama
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor used to enforce call timeouts (lazy created)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = max(1, int(os.getenv("LLM_EXECUTOR_MAX_WORKERS", "64")))
+                _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+    return _executor
+
+
 class LLMClient:
     """
     LLM client with support for multiple providers and automatic retry.
@@ -172,9 +190,14 @@ class LLMClient:
 
         Provides:
         - Concurrent request limiting (per-client semaphore)
-        - Timeout control (via thread executor for non-OpenAI providers)
+        - Timeout control (via the shared thread executor for non-OpenAI providers)
         - Retry with exponential backoff
 
+        A timed-out call cannot be interrupted, so it keeps its semaphore slot
+        until the worker actually returns, and the next attempt waits for it
+        first. The timeout starts when a worker picks the call up, so time
+        queued behind other clients on the shared pool is not counted.
+
         Args:
             fn: Callable that performs the actual LLM request
 
@@ -186,19 +209,27 @@ class LLMClient:
         """
         last_err = None
         delay = self.retry_backoff_s
+        abandoned = None
 
         for attempt in range(self.max_retries + 1):
+            if abandoned is not None:
+                # Never overlap a retry with a timed-out call that is still running
+                futures_wait([abandoned])
+                abandoned = None
             try:
-                with self._sem:
-                    if self.provider.dialect == "openai":
-                        # OpenAI: direct call, timeout via SDK parameter
-                        result = fn()
-                    else:
-                        # Others: use thread executor for timeout
-                        with ThreadPoolExecutor(max_workers=1) as ex:
-                            fut = ex.submit(fn)
-                            result = fut.result(timeout=self.timeout_s)
-                return result
+                if self.provider.dialect == "openai":
+                    # OpenAI: direct call, timeout via SDK parameter
+                    with self._sem:
+                        return fn()
+                # Others: run on the shared executor so the timeout is enforced
+                # without spinning up (and joining) a thread pool per call
+                fut, started = self._submit_timed(fn)
+                started.wait()
+                try:
+                    return fut.result(timeout=self.timeout_s)
+                except FutTimeout:
+                    abandoned = fut
+                    raise
             except (FutTimeout, Exception) as e:
                 last_err = e
                 if attempt < self.max_retries:
@@ -211,6 +242,32 @@ class LLMClient:
                     continue
                 raise last_err
 
+    def _submit_timed(self, fn):
+        """
+        Submit fn to the shared executor while holding a semaphore slot.
+
+        The slot is released by a done-callback, i.e. only once the worker has
+        finished, so abandoned calls still count against the client's limit.
+
+        Returns:
+            (future, started) where started is set when a worker begins fn
+        """
+        started = Event()
+
+        def _run():
+            started.set()
+            return fn()
+
+        sem = self._sem
+        sem.acquire()
+        try:
+            fut = _get_executor().submit(_run)
+        except BaseException:
+            sem.release()
+            raise
+        fut.add_done_callback(lambda _fut: sem.release())
+        return fut, started
+
     # -------------------------------------------------------------------------
     # Chat API
     # -------------------------------------------------------------------------
@@ -270,10 +327,14 @@ class LLMClient:
             return self._with_timeout_and_retry(_do)
 
         if self.provider.dialect == "mock":
+            openai = _get_openai()
             def _do():
-                openai = _get_openai()
                 msgs = openai["normalize_messages_for_openai"](messages, False, validate_media_url)
                 return self.client.chat(msgs)
+            if type(self.client) is _MockModel:
+                # Built-in mock is pure in-process string work: nothing to time out
+                # or retry, so skip the semaphore/executor hop entirely
+                return _do()
             return self._with_timeout_and_retry(_do)
 
         if self.provider.dialect == "ollama":
@@ -18,8 +18,11 @@ import json
 import math
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+from socialsim4.core.jsonutil import json_loads
+
 
 def generate_archetypes_from_demographics(demographics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -144,19 +147,31 @@ JSON only, no other text."""
         cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
         cleaned = re.sub(r'\s*```$', '', cleaned)
 
-    # Try to parse JSON from response
-    json_match = re.search(r'\{[\s\S]*\}', cleaned)
-    if not json_match:
+    # Cheap sniff: no braces means no JSON object to parse
+    start = cleaned.find("{")
+    end = cleaned.rfind("}")
+    if start == -1 or end < start:
         print(f"[ERROR] No JSON found in response for archetype {attrs_str}")
         print(f"[ERROR] Cleaned response: {cleaned}")
         raise RuntimeError(f"No JSON found in LLM response for archetype {attrs_str}. Response: {cleaned[:200]}")
 
+    # Common case: the response is already pure JSON
     try:
-        parsed = json.loads(json_match.group())
-    except json.JSONDecodeError as e:
-        print(f"[ERROR] JSON parse error for archetype {attrs_str}: {e}")
-        print(f"[ERROR] JSON string: {json_match.group()[:200]}")
-        raise RuntimeError(f"Failed to parse JSON for archetype {attrs_str}: {e}")
+        parsed = json_loads(cleaned)
+    except json.JSONDecodeError:
+        parsed = None
+
+    if not isinstance(parsed, dict):
+        # Fall back to the outermost {...} span inside surrounding prose
+        json_str = cleaned[start:end + 1]
+        try:
+            parsed = json_loads(json_str)
+        except json.JSONDecodeError as e:
+            print(f"[ERROR] JSON parse error for archetype {attrs_str}: {e}")
+            print(f"[ERROR] JSON string: {json_str[:200]}")
+            raise RuntimeError(f"Failed to parse JSON for archetype {attrs_str}: {e}")
+        if not isinstance(parsed, dict):
+            raise RuntimeError(f"Expected a JSON object for archetype {attrs_str}, got {type(parsed).__name__}")
 
     # Validate required fields
     if "description" not in parsed or not isinstance(parsed["description"], str):
@@ -181,7 +196,8 @@ def generate_agents_with_archetypes(
     archetype_probabilities: Optional[Dict[str, float]],
     traits: List[Dict[str, Any]],
     llm_client,
-    language: str = "en"
+    language: str = "en",
+    max_workers: int = 8,
 ) -> List[Dict[str, Any]]:
     """
     Generate agents based on demographics and archetype probabilities.
@@ -190,7 +206,8 @@ def generate_agents_with_archetypes(
     1. Generates all archetype combinations from demographics
     2. Applies custom probabilities if provided
     3. Calculates agent count per archetype
-    4. Generates agents with LLM-based descriptions and Gaussian-noised traits
+    4. Fetches LLM-based archetype descriptions concurrently
+    5. Generates agents with those descriptions and Gaussian-noised traits
 
     Args:
         total_agents: Total number of agents to generate
@@ -199,6 +216,7 @@ def generate_agents_with_archetypes(
         traits: List of trait dicts with "name", "mean", "std"
         llm_client: LLM client for archetype template generation
         language: Language code ("en" or "zh")
+        max_workers: Maximum archetype template LLM calls in flight at once
 
     Returns:
         List of agent dicts with id, name, role, profile, properties, etc.
@@ -241,17 +259,28 @@ def generate_agents_with_archetypes(
             counts[arch["id"]] = count
             remaining -= count
 
-    # Step 4: Generate agents - ONE ARCHETYPE AT A TIME
+    # Step 4: ONE LLM call per archetype to get description and roles only.
+    # The calls are independent and network-bound, so issue them concurrently.
+    active = [arch for arch in archetypes if counts.get(arch["id"], 0) > 0]
+    if len(active) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(active))) as ex:
+            futs = [
+                ex.submit(generate_archetype_template, arch, llm_client, language)
+                for arch in active
+            ]
+            templates = [f.result() for f in futs]
+    else:
+        templates = [
+            generate_archetype_template(arch, llm_client, language)
+            for arch in active
+        ]
+
+    # Step 5: Generate agents - ONE ARCHETYPE AT A TIME
     agents = []
     global_index = 0
 
-    for arch in archetypes:
-        count = counts.get(arch["id"], 0)
-        if count == 0:
-            continue
-
-        # ONE LLM call per archetype to get description and roles only
-        template = generate_archetype_template(arch, llm_client, language)
+    for arch, template in zip(active, templates):
+        count = counts[arch["id"]]
 
         # Create agents with random role and Gaussian noise on traits
         for i in range(count):
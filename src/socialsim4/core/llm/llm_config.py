@@ -1,9 +1,10 @@
 """LLM provider configuration structures."""
 
+import re
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     dialect: str
     api_key: str = ""
@@ -18,6 +19,30 @@ class LLMConfig:
     supports_vision: bool = False
 
 
+_VISION_MODEL_TOKENS = (
+    "vision",
+    "gpt-4o",
+    "gpt-4-vision",
+    "gpt-4.1",
+    "gemini-pro-vision",
+    "gemini-1.5",
+    "gemini-2",
+    "llava",
+    "llama-3.2-vision",
+    "llama-3.1-vision",
+    "llama3.2",
+    "llama3.1",
+    "qwen2-vl",
+    "qwen-vl",
+    "minicpm-v",
+    "moondream",
+    "pixtral",
+)
+# All tokens in one alternation: a single scan of the model name instead of
+# one substring search per token
+_VISION_MODEL_RE = re.compile("|".join(map(re.escape, _VISION_MODEL_TOKENS)))
+
+
 def guess_supports_vision(model: str | None) -> bool:
     """Best-effort 判断模型是否支持多模态 vision 能力。
 
@@ -25,26 +50,4 @@ def guess_supports_vision(model: str | None) -> bool:
     """
     if not model:
         return False
-    m = model.lower()
-    return any(
-        token in m
-        for token in (
-            "vision",
-            "gpt-4o",
-            "gpt-4-vision",
-            "gpt-4.1",
-            "gemini-pro-vision",
-            "gemini-1.5",
-            "gemini-2",
-            "llava",
-            "llama-3.2-vision",
-            "llama-3.1-vision",
-            "llama3.2",
-            "llama3.1",
-            "qwen2-vl",
-            "qwen-vl",
-            "minicpm-v",
-            "moondream",
-            "pixtral",
-        )
-    )
+    return _VISION_MODEL_RE.search(model.lower()) is not None
@@ -20,6 +20,28 @@ Supported scenes:
 import re
 
 
+# Werewolf role phrases ("you are the seer", "you are a werewolf", ...) matched in
+# one pass; the (seer|witch) and werewolf groups keep the accepted articles exact
+_WEREWOLF_ROLE_RE = re.compile(r"you are (?:(?:the )?(seer|witch)|(?:a )?(werewolf))")
+
+# Scene keywords found in one scan of the system prompt, then resolved by
+# _SCENE_PRIORITY (first scene whose keyword appears wins)
+_SCENE_KEYWORD_RE = re.compile(
+    r"grid-based virtual village|vote|voting|you are living in a virtual village"
+    r"|werewolf|dou dizhu|landlord"
+)
+_SCENE_BY_KEYWORD = {
+    "grid-based virtual village": "map",
+    "vote": "council",
+    "voting": "council",
+    "you are living in a virtual village": "village",
+    "werewolf": "werewolf",
+    "dou dizhu": "landlord",
+    "landlord": "landlord",
+}
+_SCENE_PRIORITY = ("map", "council", "village", "werewolf", "landlord")
+
+
 class _MockModel:
     """
     Deterministic local stub for offline testing.
@@ -56,24 +78,8 @@ class _MockModel:
         sys_lower = sys_text.lower()
 
         # Pick scene by keywords in system prompt
-        if "grid-based virtual village" in sys_lower:
-            scene = "map"
-        elif "vote" in sys_lower or "voting" in sys_lower:
-            scene = "council"
-        elif "you are living in a virtual village" in sys_lower:
-            scene = "village"
-        else:
-            # Detect scenes by keyword
-            if "werewolf" in sys_lower:
-                scene = "werewolf"
-            elif (
-                "dou dizhu" in sys_lower
-                or "landlord" in sys_lower
-                or "landlord_scene" in sys_lower
-            ):
-                scene = "landlord"
-            else:
-                scene = "chat"
+        found = {_SCENE_BY_KEYWORD[k] for k in _SCENE_KEYWORD_RE.findall(sys_lower)}
+        scene = next((s for s in _SCENE_PRIORITY if s in found), "chat")
 
         if scene == "council":
             thought, plan, action, plan_update = self._council_response(agent_name, call_n)
@@ -147,14 +153,14 @@ class _MockModel:
 
     def _werewolf_response(self, sys_lower: str, call_n: int) -> tuple:
         """Generate response for werewolf scene based on role."""
-        # Heuristic role detection from system profile
+        # Heuristic role detection from system profile: one regex scan collects
+        # every role phrase, then priority seer > witch > werewolf is a set probe
+        found = {a or b for a, b in _WEREWOLF_ROLE_RE.findall(sys_lower)}
         role = "villager"
-        if "you are the seer" in sys_lower or "you are seer" in sys_lower:
-            role = "seer"
-        elif "you are the witch" in sys_lower or "you are witch" in sys_lower:
-            role = "witch"
-        elif "you are a werewolf" in sys_lower or "you are werewolf" in sys_lower:
-            role = "werewolf"
+        for candidate in ("seer", "witch", "werewolf"):
+            if candidate in found:
+                role = candidate
+                break
 
         # Use fixed names from demo to make actions meaningful
         default_targets = ["Pia", "Taro", "Elena", "Bram", "Ronan", "Mira"]
@@ -13,12 +13,28 @@ The Ollama provider supports:
 - Vision-capable models (llava, llama-3.2-vision, etc.)
 - Custom base URLs for remote Ollama instances
 - Environment variable configuration via OLLAMA_BASE_URL
+- OLLAMA_KEEP_ALIVE (e.g. "30m", "-1") to keep models loaded between calls
+  instead of the server default, so sparse simulation turns skip reloads
 """
 
 import base64
+import os
+
 import httpx
 
 
+def _with_keep_alive(payload: dict) -> dict:
+    """Attach keep_alive from OLLAMA_KEEP_ALIVE to a request payload when set."""
+    keep_alive = os.getenv("OLLAMA_KEEP_ALIVE")
+    if keep_alive:
+        # Bare numbers are seconds (-1 = forever); Ollama wants those as ints
+        try:
+            payload["keep_alive"] = int(keep_alive)
+        except ValueError:
+            payload["keep_alive"] = keep_alive
+    return payload
+
+
 def create_ollama_client(base_url: str | None = None, timeout: float = 30) -> httpx.Client:
     """
     Create an httpx client for Ollama API.
@@ -179,7 +195,7 @@ def ollama_chat(
             "num_predict": max_tokens,
         },
     }
-    resp = client.post("/api/chat", json=payload, timeout=timeout)
+    resp = client.post("/api/chat", json=_with_keep_alive(payload), timeout=timeout)
     resp.raise_for_status()
     data = resp.json()
     message = data.get("message") or {}
@@ -221,7 +237,7 @@ def ollama_completion(
             "num_predict": max_tokens,
         },
     }
-    resp = client.post("/api/generate", json=payload, timeout=timeout)
+    resp = client.post("/api/generate", json=_with_keep_alive(payload), timeout=timeout)
     resp.raise_for_status()
     data = resp.json()
     return str(data.get("response") or "").strip()
@@ -249,7 +265,7 @@ def ollama_embedding(
         ValueError: If Ollama doesn't return an embedding
     """
     payload = {"model": model, "prompt": text}
-    resp = client.post("/api/embeddings", json=payload, timeout=timeout)
+    resp = client.post("/api/embeddings", json=_with_keep_alive(payload), timeout=timeout)
     resp.raise_for_status()
     data = resp.json()
     embedding = data.get("embedding")
@@ -3,7 +3,9 @@ URL validation and SSRF (Server-Side Request Forgery) prevention utilities.
 
 Contains:
     - _ALLOWED_URL_SCHEMES: Allowed URL schemes for media content
+    - _ALLOWED_URL_PREFIXES: The schemes as "<scheme>:" prefixes
     - _PRIVATE_NETWORK_PATTERNS: Regex patterns for private/internal networks
+    - _PRIVATE_NETWORK_RE: All patterns fused into one precompiled regex
     - _is_private_network_url: Check if URL points to private network
     - validate_media_url: Validate media URLs with SSRF prevention
 
@@ -21,6 +23,9 @@ from urllib.parse import urlparse
 # SSRF prevention: allowed URL schemes for media content
 _ALLOWED_URL_SCHEMES = {"http", "https", "data"}
 
+# "<scheme>:" prefixes built once so the check is a single str.startswith
+_ALLOWED_URL_PREFIXES = tuple(f"{scheme}:" for scheme in sorted(_ALLOWED_URL_SCHEMES))
+
 # SSRF prevention: denylist of private/internal network patterns
 # These patterns prevent the vision model from accessing internal resources
 _PRIVATE_NETWORK_PATTERNS = (
@@ -36,6 +41,12 @@ _PRIVATE_NETWORK_PATTERNS = (
     r"0\.0\.0\.0",  # 0.0.0.0
 )
 
+# Compiled once at import: a single search per hostname instead of one
+# re.search (and pattern-cache lookup) per denylist entry.
+_PRIVATE_NETWORK_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _PRIVATE_NETWORK_PATTERNS), re.IGNORECASE
+)
+
 
 def _is_private_network_url(url: str) -> bool:
     """
@@ -55,9 +66,8 @@ def _is_private_network_url(url: str) -> bool:
         hostname = parsed.hostname or ""
 
         # Check against private network patterns
-        for pattern in _PRIVATE_NETWORK_PATTERNS:
-            if re.search(pattern, hostname, re.IGNORECASE):
-                return True
+        if _PRIVATE_NETWORK_RE.search(hostname):
+            return True
 
         # Block metadata addresses like <metadata> in cloud providers
         if hostname in ("metadata", "169.254.169.254"):
@@ -85,7 +95,7 @@ def validate_media_url(url: str) -> Literal["valid", "invalid_scheme", "private_
         return "invalid_scheme"
 
     # Check scheme
-    if not any(url.startswith(f"{scheme}:") for scheme in _ALLOWED_URL_SCHEMES):
+    if not url.startswith(_ALLOWED_URL_PREFIXES):
         return "invalid_scheme"
 
     # Check for private network addresses
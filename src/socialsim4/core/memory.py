@@ -1,6 +1,38 @@
 class ShortTermMemory:
+    """Per-agent conversation history.
+
+    Consecutive plain-text messages from the same role are merged into one
+    entry. The merge is applied lazily: reading ``history`` / ``get_all()``
+    returns the stored list with every pending merge applied, but a list
+    obtained earlier is not updated by later same-role appends. Read it again
+    after appending instead of holding on to it.
+    """
+
+    # One instance per agent per simulation node; slots drop the per-instance
+    # dict since the attribute set is fixed.
+    __slots__ = ("_history", "_tail_parts")
+
     def __init__(self):
-        self.history = []
+        self._history = []
+        # Text parts still to be merged into the last entry. Consecutive
+        # same-role text messages are collected here and joined once on read,
+        # instead of re-copying the growing string on every append.
+        self._tail_parts = None
+
+    @property
+    def history(self):
+        self._flush()
+        return self._history
+
+    @history.setter
+    def history(self, value):
+        self._history = value
+        self._tail_parts = None
+
+    def _flush(self):
+        if self._tail_parts is not None:
+            self._history[-1]["content"] = "\n".join(self._tail_parts)
+            self._tail_parts = None
 
     def append(self, role, content, images=None, audio=None, video=None):
         """Append a message to memory.
@@ -22,15 +54,19 @@ class ShortTermMemory:
         entry = {"role": role, "content": text, "images": images, "audio": audio, "video": video}
 
         # 仅在都是纯文本且同角色时合并，避免图像信息丢失
-        if self.history and self.history[-1]["role"] == role:
-            last = self.history[-1]
+        if self._history and self._history[-1]["role"] == role:
+            last = self._history[-1]
             if not last.get("images") and not images and not last.get("audio") and not audio and not last.get("video") and not video:
-                last["content"] += f"\n{text}"
+                if self._tail_parts is None:
+                    self._tail_parts = [last["content"]]
+                self._tail_parts.append(text)
                 return
 
-        self.history.append(entry)
+        self._flush()
+        self._history.append(entry)
 
     def get_all(self):
+        """Return the history list, current as of this call (see class docstring)."""
         return self.history
 
     def clear(self):
@@ -52,4 +88,4 @@ class ShortTermMemory:
             raise NotImplementedError(f"Unknown dialect: {dialect}")
 
     def __len__(self):
-        return len(self.history)
+        return len(self._history)
@@ -6,8 +6,18 @@ through explicit phases without requiring a dedicated "host" agent.
 """
 
 from enum import Enum
+from itertools import islice
 from typing import Tuple, Optional, Dict, Any, List
 
+# Actions that can be used in any phase
+PHASELESS_ACTIONS = frozenset({"send_message", "yield", "voting_status", "request_brief"})
+
+# Actions that count as real progress when checking for a stalemate
+SUBSTANTIVE_ACTIONS = frozenset({"send_message", "start_voting", "request_brief"})
+
+# Only this much of each turn's content is ever shown in the voting prompt
+CONTENT_PREVIEW_CHARS = 100
+
 
 class CouncilPhase(Enum):
     """Council meeting phases."""
@@ -54,7 +64,7 @@ class SystemFacilitator:
             "turn": self.turn_count,
             "agent": agent_name,
             "action": action_name,
-            "content": content[:500],  # Truncate for memory
+            "content": content[:CONTENT_PREVIEW_CHARS],  # Truncate for memory
         })
 
     def should_suggest_voting(self) -> Tuple[bool, str]:
@@ -153,10 +163,7 @@ class SystemFacilitator:
         Returns:
             (allowed, error_message): Tuple of permission status and error if not allowed
         """
-        # Actions that can be used in any phase
-        phaseless_actions = {"send_message", "yield", "voting_status", "request_brief"}
-
-        if action_name in phaseless_actions:
+        if action_name in PHASELESS_ACTIONS:
             return True, None
 
         # Phase-specific validation
@@ -194,7 +201,7 @@ class SystemFacilitator:
             return False, "Insufficient discussion"
 
         conversation_summary = "\n".join([
-            f"- {h['agent']}: {h['action']}" + (f" - {h['content'][:100]}..." if h['content'] else "")
+            f"- {h['agent']}: {h['action']}" + (f" - {h['content']}..." if h['content'] else "")
             for h in recent_history
         ])
 
@@ -268,11 +275,21 @@ Respond with 'YES: [brief reason]' or 'NO: [brief reason]'."""
 
         # Simple heuristic: if all recent turns are just voting or yield
         # without substantive messages, consider it stale
-        recent = self.conversation_history[-self.stalemate_threshold:]
-        substantive_actions = {"send_message", "start_voting", "request_brief"}
-        substantive_count = sum(1 for h in recent if h["action"] in substantive_actions)
-
-        return substantive_count < 2  # Less than 2 substantive actions in threshold turns
+        # Less than 2 substantive actions in threshold turns. Walk back from
+        # the newest turn and stop as soon as the second one is found.
+        threshold = self.stalemate_threshold
+        if threshold > 0:
+            recent = islice(reversed(self.conversation_history), threshold)
+        else:
+            # history[-0:] is the whole history; keep the original slice here
+            recent = self.conversation_history[-threshold:]
+        substantive_count = 0
+        for h in recent:
+            if h["action"] in SUBSTANTIVE_ACTIONS:
+                substantive_count += 1
+                if substantive_count >= 2:
+                    return False
+        return True
 
     def get_facilitation_message(self) -> Optional[str]:
         """
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from .actions.base_actions import SendMessageAction, TalkToAction, YieldAction, SpeakAction
 from .actions.council_actions import (
     FinishMeetingAction,
@@ -85,7 +87,7 @@ ACTION_SPACE_MAP = {
     "no_double": NoDoubleAction(),
 }
 
-SCENE_MAP = {
+SCENE_MAP = MappingProxyType({
     "simple_chat_scene": SimpleChatScene,
     "emotional_conflict_scene": SimpleChatScene,
     "council_scene": CouncilScene,
@@ -93,41 +95,42 @@ SCENE_MAP = {
     "werewolf_scene": WerewolfScene,
     "landlord_scene": LandlordPokerScene,
     "generic_scene": GenericScene,
-}
+})
 
 ORDERING_MAP = _ORDERING_MAP
 
 # Scene action registry: declares common (basic) actions provided by the scene
 # and optional per-agent actions that can be toggled. Keep action names aligned
-# with ACTION_SPACE_MAP keys.
-SCENE_ACTIONS: dict[str, dict[str, list[str]]] = {
+# with ACTION_SPACE_MAP keys. Exposed as a read-only view with tuple entries:
+# callers only look entries up, so there is no need to hand out defensive copies.
+_SCENE_ACTIONS: dict[str, dict[str, tuple[str, ...]]] = {
     "simple_chat_scene": {
-        "basic": ["send_message", "yield"],
-        "allowed": ["web_search", "view_page", "query_knowledge", "list_knowledge"],
+        "basic": ("send_message", "yield"),
+        "allowed": ("web_search", "view_page", "query_knowledge", "list_knowledge"),
     },
     "emotional_conflict_scene": {
-        "basic": ["send_message", "yield"],
-        "allowed": ["web_search", "view_page", "query_knowledge", "list_knowledge"],
+        "basic": ("send_message", "yield"),
+        "allowed": ("web_search", "view_page", "query_knowledge", "list_knowledge"),
     },
     "council_scene": {
-        "basic": ["send_message", "voting_status", "yield"],
-        "allowed": ["start_voting", "finish_meeting", "request_brief", "vote", "web_search", "view_page", "query_knowledge", "list_knowledge"],
+        "basic": ("send_message", "voting_status", "yield"),
+        "allowed": ("start_voting", "finish_meeting", "request_brief", "vote", "web_search", "view_page", "query_knowledge", "list_knowledge"),
     },
     "village_scene": {
-        "basic": ["talk_to", "move_to_location", "look_around", "gather_resource", "rest", "yield"],
-        "allowed": ["query_knowledge", "list_knowledge"],
+        "basic": ("talk_to", "move_to_location", "look_around", "gather_resource", "rest", "yield"),
+        "allowed": ("query_knowledge", "list_knowledge"),
     },
     "werewolf_scene": {
-        "basic": ["speak", "vote_lynch", "yield"],
-        "allowed": ["open_voting", "close_voting", "night_kill", "inspect", "witch_save", "witch_poison"],
+        "basic": ("speak", "vote_lynch", "yield"),
+        "allowed": ("open_voting", "close_voting", "night_kill", "inspect", "witch_save", "witch_poison"),
     },
     "landlord_scene": {
-        "basic": ["yield"],
-        "allowed": ["call_landlord", "rob_landlord", "pass", "play_cards", "double", "no_double"],
+        "basic": ("yield",),
+        "allowed": ("call_landlord", "rob_landlord", "pass", "play_cards", "double", "no_double"),
     },
     "generic_scene": {
-        "basic": ["yield"],
-        "allowed": [
+        "basic": ("yield",),
+        "allowed": (
             # Communication
             "send_message", "talk_to", "speak",
             # Movement
@@ -144,12 +147,14 @@ SCENE_ACTIONS: dict[str, dict[str, list[str]]] = {
             "vote_lynch", "night_kill", "inspect", "witch_save", "witch_poison", "open_voting", "close_voting",
             # Landlord
             "call_landlord", "rob_landlord", "pass", "play_cards", "double", "no_double",
-        ],
+        ),
     },
 }
 
+SCENE_ACTIONS = MappingProxyType(_SCENE_ACTIONS)
+
 # Scene descriptions for selection UI and docs
-SCENE_DESCRIPTIONS: dict[str, str] = {
+_SCENE_DESCRIPTIONS: dict[str, str] = {
     "simple_chat_scene": "Open chat room with optional web tools. Agents converse naturally; use search/page tools when needed.",
     "emotional_conflict_scene": "Guided emotional dialogue among participants in a chat room; designed to surface and reconcile feelings.",
     "council_scene": "Legislative council debate and voting around a draft text; supports voting and status actions.",
@@ -157,4 +162,6 @@ SCENE_DESCRIPTIONS: dict[str, str] = {
     "werewolf_scene": "Social deduction game with night/day phases and role-specific actions (moderated flow).",
     "landlord_scene": "Dou Dizhu (Landlord) card game flow with bidding, playing, and scoring stages.",
     "generic_scene": "A flexible scene type composed from template configuration. Supports custom mechanics and semantic actions.",
-}
\ No newline at end of file
+}
+
+SCENE_DESCRIPTIONS = MappingProxyType(_SCENE_DESCRIPTIONS)
@@ -38,14 +38,11 @@ class Scene:
 
     def parse_and_handle_action(self, action_data, agent: Agent, simulator: Simulator):
         action_name = action_data.get("action")
-        print(f"Action Space({agent.name}):", agent.action_space)
-
-        # Find the action instance first (for validation)
-        action_instance = None
-        for act in agent.action_space:
-            if act.NAME == action_name:
-                action_instance = act
-                break
+
+        # Find the action instance first (for validation); stops at the first match
+        action_instance = next(
+            (act for act in agent.action_space if act.NAME == action_name), None
+        )
 
         # Validate using the action instance's constraints
         allowed, error = self.action_controller.validate_action(
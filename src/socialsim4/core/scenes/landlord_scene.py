@@ -1,4 +1,5 @@
 import random
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
 from socialsim4.core.actions.base_actions import SendMessageAction, YieldAction
@@ -15,7 +16,7 @@ from socialsim4.core.event import PublicEvent
 from socialsim4.core.scene import Scene
 from socialsim4.core.simulator import Simulator
 
-RANK_ORDER = [
+RANK_ORDER = (
     "3",
     "4",
     "5",
@@ -31,7 +32,7 @@ RANK_ORDER = [
     "2",
     "SJ",
     "BJ",
-]
+)
 RANK_VALUE = {r: i for i, r in enumerate(RANK_ORDER, start=3)}
 
 
@@ -402,15 +403,13 @@ class LandlordPokerScene(Scene):
         parts = [p.strip() for p in s.strip().split(" ") if p.strip()]
         # strict tokens only
         for p in parts:
-            if p not in RANK_ORDER:
+            if p not in RANK_VALUE:
                 raise ValueError("Unknown card token: " + p)
         return parts
 
     def _has_cards(self, name: str, tokens: List[str]) -> bool:
         hand = self.state.get("hands")[name]
-        counts: Dict[str, int] = {}
-        for t in tokens:
-            counts[t] = counts.get(t, 0) + 1
+        counts = Counter(tokens)
         for r, c in counts.items():
             if hand.get(r, 0) < c:
                 return False
@@ -432,10 +431,8 @@ class LandlordPokerScene(Scene):
     # ----- Combination evaluation -----
     def _evaluate_combo(self, tokens: List[str]) -> Optional[Dict]:
         n = len(tokens)
-        counts: Dict[str, int] = {}
-        for t in tokens:
-            counts[t] = counts.get(t, 0) + 1
-        ranks_sorted = sorted(counts.keys(), key=lambda r: RANK_VALUE[r])
+        counts = Counter(tokens)
+        ranks_sorted = sorted(counts.keys(), key=RANK_VALUE.__getitem__)
 
         def is_consecutive(rs: List[str]) -> bool:
             # No 2 or jokers in straights
@@ -507,14 +504,14 @@ class LandlordPokerScene(Scene):
         if n % 2 == 0:
             pair_ranks = [r for r, c in counts.items() if c == 2]
             if len(pair_ranks) * 2 == n:
-                ps = sorted(pair_ranks, key=lambda r: RANK_VALUE[r])
+                ps = sorted(pair_ranks, key=RANK_VALUE.__getitem__)
                 if len(ps) >= 3 and is_consecutive(ps):
                     return {"type": "double_seq", "key": ps[-1], "len": n}
 
         # Triple sequence (>=2 triples) and airplanes
         triple_ranks = [r for r, c in counts.items() if c == 3]
         if triple_ranks:
-            ts = sorted(triple_ranks, key=lambda r: RANK_VALUE[r])
+            ts = sorted(triple_ranks, key=RANK_VALUE.__getitem__)
             if len(ts) >= 2 and is_consecutive(ts):
                 m = len(ts)
                 if n == m * 3:
@@ -537,7 +534,7 @@ class LandlordPokerScene(Scene):
                 if n == m * 5:
                     pairs = [r for r, c in counts.items() if r not in ts and c == 2]
                     if len(pairs) == m:
-                        pr = sorted(pairs, key=lambda r: RANK_VALUE[r])
+                        pr = sorted(pairs, key=RANK_VALUE.__getitem__)
                         return {
                             "type": "airplane_pairs",
                             "key": ts[-1],
@@ -1,5 +1,8 @@
 import heapq
 import math
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from socialsim4.core.actions.base_actions import TalkToAction
@@ -14,10 +17,33 @@ from socialsim4.core.event import StatusEvent
 from socialsim4.core.scene import Scene
 from socialsim4.core.simulator import Simulator
 
+# Colored render_ascii glyphs, one dict lookup per cell instead of an if-chain
+_ASCII_COLORED = {
+    ".": "\x1b[2m.\x1b[0m",  # dim
+    "#": "\x1b[90m#\x1b[0m",  # gray
+    "L": "\x1b[33mL\x1b[0m",  # yellow
+    "A": "\x1b[36mA\x1b[0m",  # cyan
+    "*": "\x1b[35m*\x1b[0m",  # magenta
+}
+
+# Number of location names listed in the compact scene description
+_LOCATION_PREVIEW_LIMIT = 5
+
 
 class MapLocation:
     """地图上的一个位置点"""
 
+    __slots__ = (
+        "name",
+        "x",
+        "y",
+        "location_type",
+        "description",
+        "resources",
+        "capacity",
+        "agents_here",
+    )
+
     def __init__(
         self,
         name: str,
@@ -58,6 +84,9 @@ class MapLocation:
 class Tile:
     """A single grid tile."""
 
+    # One instance per grid cell, so skip the per-instance __dict__
+    __slots__ = ("passable", "movement_cost", "terrain", "resources")
+
     def __init__(
         self,
         passable: bool = True,
@@ -98,6 +127,18 @@ class GameMap:
         self.grid = {}  # 坐标到位置名称的映射
         # Sparse storage of tiles: only store non-default tiles explicitly
         self.tiles: Dict[Tuple[int, int], Tile] = {}
+        # Joined names of the first few locations, used in every compact scene
+        # description; rebuilt only when add_location changes the set
+        self._location_preview: Optional[str] = None
+
+    def location_preview(self) -> str:
+        """Comma-joined names of the first few locations."""
+        if self._location_preview is None:
+            self._location_preview = ", ".join(
+                loc.name
+                for loc in islice(self.locations.values(), _LOCATION_PREVIEW_LIMIT)
+            )
+        return self._location_preview
 
     def serialize(self):
         """Serializes the map to a dictionary."""
@@ -129,13 +170,12 @@ class GameMap:
         """
         # Build quick lookups
         loc_by_xy = {(loc.x, loc.y): loc for loc in self.locations.values()}
-        agents_xy: Dict[Tuple[int, int], int] = {}
+        agents_xy: Counter = Counter()
         if agents:
             for a in agents.values():
                 xy = a.properties.get("map_xy") or [None, None]
                 if xy and xy[0] is not None and xy[1] is not None:
-                    key = (int(xy[0]), int(xy[1]))
-                    agents_xy[key] = agents_xy.get(key, 0) + 1
+                    agents_xy[(int(xy[0]), int(xy[1]))] += 1
 
         rows: List[str] = []
         for y in range(self.height):
@@ -149,18 +189,7 @@ class GameMap:
                     ch = "A"
                 elif cnt > 1:
                     ch = "*"
-                if color:
-                    if ch == ".":
-                        ch = "\x1b[2m.\x1b[0m"  # dim
-                    elif ch == "#":
-                        ch = "\x1b[90m#\x1b[0m"  # gray
-                    elif ch == "L":
-                        ch = "\x1b[33mL\x1b[0m"  # yellow
-                    elif ch == "A":
-                        ch = "\x1b[36mA\x1b[0m"  # cyan
-                    elif ch == "*":
-                        ch = "\x1b[35m*\x1b[0m"  # magenta
-                row.append(ch)
+                row.append(_ASCII_COLORED[ch] if color else ch)
             rows.append("".join(row))
         header = f"Map {self.width}x{self.height}"
         if color:
@@ -217,6 +246,7 @@ class GameMap:
             )
             self.locations[name] = location
             self.grid[(x, y)] = name
+            self._location_preview = None
             return True
         return False
 
@@ -235,7 +265,7 @@ class GameMap:
         """获取附近的位置"""
         nearby = []
         for location in sorted(
-            self.locations.values(), key=lambda loc: (loc.y, loc.x, loc.name)
+            self.locations.values(), key=attrgetter("y", "x", "name")
         ):
             distance = abs(location.x - x) + abs(location.y - y)
             if distance <= radius:
@@ -398,7 +428,7 @@ You have coordinates, needs (hunger, energy), and an inventory. You can move acr
 
     def get_compact_description(self):
         """Compact description for 4B models."""
-        locations = ", ".join([loc.name for loc in list(self.game_map.locations.values())[:5]])
+        locations = self.game_map.location_preview()
         return f"Village {self.game_map.width}x{self.game_map.height} grid. Locations: {locations}. Energy ↓ with actions. Chat range: {self.chat_range}."
 
     def get_behavior_guidelines(self):
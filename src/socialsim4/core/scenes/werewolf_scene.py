@@ -87,10 +87,9 @@ class WerewolfScene(Scene):
         return self.state.get("roles", {}).get(name)
 
     def _count_roles(self) -> Tuple[int, int]:
-        alive = self._alive()
-        wolves = sum(1 for n in alive if self._role(n) == "werewolf")
-        villagers = sum(1 for n in alive if self._role(n) == "villager")
-        return wolves, villagers
+        roles = self.state.get("roles", {})
+        counts = Counter(roles.get(n) for n in self.state.get("alive", []))
+        return counts["werewolf"], counts["villager"]
 
     def _check_win(self):
         wolves, villagers = self._count_roles()
@@ -226,10 +225,12 @@ class WerewolfScene(Scene):
 
     def _resolve_night(self, simulator: Simulator):
         votes: Dict[str, str] = self.state.get("night_kill_votes", {})
+        # Snapshot the living set once; the checks below run per vote
+        alive = set(self._alive())
         filtered = {
             v: t
             for v, t in votes.items()
-            if self._is_alive(v) and self._role(v) == "werewolf"
+            if v in alive and self._role(v) == "werewolf"
         }
         victim: Optional[str] = None
         first_night = self.state.get("day_count", 0) == 0
@@ -238,7 +239,7 @@ class WerewolfScene(Scene):
             candidate = counts.most_common(1)[0][0]
             if (
                 (not first_night)
-                and self._is_alive(candidate)
+                and candidate in alive
                 and self._role(candidate) != "werewolf"
             ):
                 victim = candidate
@@ -246,7 +247,7 @@ class WerewolfScene(Scene):
         poison_targets = [
             a["poison_target"]
             for a in self.state.get("witch_actions", {}).values()
-            if a.get("poison_target") and self._is_alive(a["poison_target"])
+            if a.get("poison_target") and a["poison_target"] in alive
         ]
         deaths: List[str] = [victim] if victim and not saved else []
         deaths += [t for t in poison_targets if t not in deaths]
@@ -281,14 +282,15 @@ class WerewolfScene(Scene):
             self.state["day_spoken"] = []
 
     def _resolve_lynch(self, simulator: Simulator, prefer_plurality: bool = True):
+        alive = set(self._alive())
         counts = Counter(
             t
             for v, t in self.state.get("lynch_votes", {}).items()
-            if self._is_alive(v) and self._is_alive(t)
+            if v in alive and t in alive
         )
         lynched: Optional[str] = None
         if counts:
-            need = len(self._alive()) // 2 + 1
+            need = len(alive) // 2 + 1
             lynched = next((t for t, c in counts.items() if c >= need), None)
             if lynched is None and prefer_plurality:
                 top2 = counts.most_common(2)
@@ -324,10 +326,11 @@ class WerewolfScene(Scene):
             )
             if phase == "night":
                 votes: Dict[str, str] = self.state.get("night_kill_votes", {})
+                living = set(self._alive())
                 filtered = {
                     v: t
                     for v, t in votes.items()
-                    if self._is_alive(v) and self._role(v) == "werewolf"
+                    if v in living and self._role(v) == "werewolf"
                 }
                 victim = "none"
                 first_night = self.state.get("day_count", 0) == 0
@@ -336,7 +339,7 @@ class WerewolfScene(Scene):
                     candidate = counts.most_common(1)[0][0]
                     if (
                         (not first_night)
-                        and self._is_alive(candidate)
+                        and candidate in living
                         and self._role(candidate) != "werewolf"
                     ):
                         victim = candidate
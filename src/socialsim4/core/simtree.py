@@ -1,10 +1,11 @@
-import json
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
 import os
 
 from socialsim4.core.event import PublicEvent
+from socialsim4.core.jsonutil import json_copy
 from socialsim4.core.simulator import Simulator
 from socialsim4.services.llm_client_pool import LLMClientPool
 
@@ -16,6 +17,15 @@ class SimCloneError(RuntimeError):
     pass
 
 
+def _deliver_to_subs(subs: tuple, entry: dict) -> None:
+    """Push one log entry into each subscriber queue (runs on the event loop)."""
+    for q in subs:
+        try:
+            q.put_nowait(entry)
+        except Exception:
+            logger.exception("failed to deliver node event to subscriber")
+
+
 class SimTree:
     def __init__(
         self,
@@ -46,7 +56,8 @@ class SimTree:
         self._seq: int = 0
 
         # 节点级订阅：node_id -> [asyncio.Queue / SimpleQueue]
-        self._node_subs: Dict[int, List[object]] = {}
+        # defaultdict：注册时直接 append，读取处仍用 .get() 避免凭空建 key
+        self._node_subs: Dict[int, List[object]] = defaultdict(list)
 
         # Tree-level broadcast sink (wired by backend runtime to WS subscribers)
         self._tree_broadcast = lambda event: None
@@ -128,7 +139,7 @@ class SimTree:
 
         # 1) 通过 serialize -> deserialize 克隆 simulator
         snap = sim.serialize()
-        sim_clone = Simulator.deserialize(snap, root_clients, log_handler=None)
+        sim_clone = Simulator.deserialize(snap, root_clients, log_handler=None, copy=False)
 
         # 2) 克隆点的 event_queue 必须是“干净”的
         sim_clone.reset_event_queue()
@@ -180,9 +191,10 @@ class SimTree:
             # 未启用池时，仍然回退到“共用 self.clients”的旧行为
             branch_clients = self.clients
 
-        # Simulator.serialize 已经用 deepcopy 做了深拷贝，这里不再做 json roundtrip
+        # Simulator.serialize 已经用 deepcopy 做了深拷贝，这里不再做 json roundtrip，
+        # deserialize 也无需再拷贝一次（snap 仅此处持有）
         snap = base_sim.serialize()
-        sim_copy = Simulator.deserialize(snap, branch_clients, log_handler=None)
+        sim_copy = Simulator.deserialize(snap, branch_clients, log_handler=None, copy=False)
 
         # 先清空 clone 的 event_queue，再做一次完整自检
         sim_copy.reset_event_queue()
@@ -294,7 +306,7 @@ class SimTree:
         nid = self._next_id()
         parent_logs = list(self.nodes[node_id].get("logs", []))
         # Deep copy parent's logs so child does not share dict references
-        child_logs: List[dict] = json.loads(json.dumps(parent_logs))
+        child_logs: List[dict] = json_copy(parent_logs)
         node = {
             "id": nid,
             "parent": None,
@@ -330,9 +342,13 @@ class SimTree:
 
             subs = self._node_subs.get(node_id) or []
             if self._loop is not None:
-                for q in subs:
+                if subs:
+                    # One loop wakeup per entry rather than one per subscriber;
+                    # snapshot the list since it may change before the callback runs
                     try:
-                        self._loop.call_soon_threadsafe(q.put_nowait, entry)
+                        self._loop.call_soon_threadsafe(
+                            _deliver_to_subs, tuple(subs), entry
+                        )
                     except Exception:
                         logger.exception("failed to deliver node event to subscriber")
             else:
@@ -358,11 +374,7 @@ class SimTree:
 
     # Per-node subscription for delta streaming (used by DevUI WS)
     def add_node_sub(self, node_id: int, q: object) -> None:
-        lst = self._node_subs.get(node_id)
-        if lst is None:
-            lst = []
-            self._node_subs[node_id] = lst
-        lst.append(q)
+        self._node_subs[node_id].append(q)
 
     def remove_node_sub(self, node_id: int, q: object) -> None:
         lst = self._node_subs.get(node_id)
@@ -477,9 +489,7 @@ class SimTree:
             elif m == "advance":
                 et = "advance"
         node["edge_type"] = et
-        if parent_id not in self.children:
-            self.children[parent_id] = []
-        self.children[parent_id].append(cid)
+        self.children.setdefault(parent_id, []).append(cid)
         return cid
 
     def advance(self, parent_id: int, turns: int = 1) -> int:
@@ -575,13 +585,15 @@ class SimTree:
         items.sort(key=lambda x: int(x["id"]))
         return items
 
+    def iter_leaves(self) -> Iterator[int]:
+        """Yield leaf node ids lazily, in node insertion order."""
+        children = self.children
+        for nid in self.nodes:
+            if not children.get(nid):
+                yield nid
+
     def leaves(self) -> List[int]:
-        res: List[int] = []
-        for nid in self.nodes.keys():
-            if len(self.children.get(nid, [])) == 0:
-                res.append(nid)
-        res.sort()
-        return res
+        return sorted(self.iter_leaves())
 
     def max_depth(self) -> int:
         m = 0
@@ -593,14 +605,14 @@ class SimTree:
 
     def frontier(self, only_max_depth: bool = True) -> List[int]:
         lf = self.leaves()
-        if not only_max_depth:
+        if not only_max_depth or not lf:
             return lf
-        md = self.max_depth()
-        res: List[int] = []
-        for nid in lf:
-            if int(self.nodes[nid]["depth"]) == md:
-                res.append(nid)
-        return res
+        # The deepest node is always a leaf, so the max depth comes from the
+        # leaves already in hand rather than a second scan over every node
+        nodes = self.nodes
+        depths = [int(nodes[nid]["depth"]) for nid in lf]
+        md = max(depths)
+        return [nid for nid, d in zip(lf, depths) if d == md]
 
     def advance_frontier(
         self, turns: int = 1, only_max_depth: bool = True
@@ -151,9 +151,11 @@ class Simulator:
         if attachment_texts:
             enriched = f"{formatted}\n" + "\n".join(attachment_texts)
 
+        # Set membership keeps the per-agent receiver check O(1)
+        receiver_set = None if receivers is None else set(receivers)
         recipients = []
         for agent in self.agents.values():
-            if agent.name != sender and (receivers is None or agent.name in receivers):
+            if agent.name != sender and (receiver_set is None or agent.name in receiver_set):
                 agent.add_env_feedback(enriched, images=images, audio=audio, video=video)
                 recipients.append(agent.name)
 
@@ -195,8 +197,11 @@ class Simulator:
         return deepcopy(snap)
 
     @classmethod
-    def deserialize(cls, data, clients, log_handler=None):
-        data = deepcopy(data)
+    def deserialize(cls, data, clients, log_handler=None, copy=True):
+        # copy=False lets callers that own a fresh snapshot (e.g. straight from
+        # serialize(), which already deep-copies) skip a second full deepcopy
+        if copy:
+            data = deepcopy(data)
         # Note: clients are not serialized and must be passed in.
         scenario_data = data["scene"]
         from socialsim4.core.registry import SCENE_MAP
@@ -66,29 +66,32 @@ def make_clients_from_env() -> Dict[str, object]:
     return make_clients(settings)
 
 
+# Supported dialects and the model used when LLM_MODEL is not set
+_DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "gemini": "gemini-2.0-flash-exp",
+    "mock": "mock",
+    "ollama": "llava:latest",
+}
+
+
 def make_clients(settings: LLMSettings) -> Dict[str, object]:
     dialect = (settings.dialect or "").lower()
-    if dialect not in {"openai", "gemini", "mock", "ollama"}:
+    if dialect not in _DEFAULT_MODELS:
         raise ValueError(f"Unsupported LLM dialect: {settings.dialect}")
 
-    default_models = {
-        "openai": "gpt-4o-mini",
-        "gemini": "gemini-2.0-flash-exp",
-        "mock": "mock",
-        "ollama": "llava:latest",
-    }
-
+    model = settings.model or _DEFAULT_MODELS[dialect]
     config = LLMConfig(
         dialect=dialect,
         api_key=settings.api_key or "",
-        model=settings.model or default_models[dialect],
+        model=model,
         base_url=settings.base_url or ("http://127.0.0.1:11434" if dialect == "ollama" else None),
         temperature=settings.temperature or 0.7,
         top_p=settings.top_p or 1.0,
         frequency_penalty=settings.frequency_penalty or 0.0,
         presence_penalty=settings.presence_penalty or 0.0,
         max_tokens=settings.max_tokens or 1024,
-        supports_vision=guess_supports_vision(settings.model or default_models[dialect]),
+        supports_vision=guess_supports_vision(model),
     )
 
     client = create_llm_client(config)
@@ -8,7 +8,6 @@ semantic actions.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +15,7 @@ import yaml
 
 from socialsim4.core.action import Action
 from socialsim4.core.agent import Agent
+from socialsim4.core.jsonutil import json_loads
 from socialsim4.core.scene import Scene
 from socialsim4.templates.mechanics import create_mechanic
 from socialsim4.templates.semantic_actions import SemanticAction, SemanticActionFactory
@@ -69,7 +69,7 @@ class TemplateLoader:
             content = f.read()
 
         if suffix == ".json":
-            data = json.loads(content)
+            data = json_loads(content)
         elif suffix in (".yaml", ".yml"):
             data = yaml.safe_load(content)
         else:
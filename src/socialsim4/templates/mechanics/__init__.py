@@ -15,10 +15,16 @@ from socialsim4.templates.mechanics.base import CoreMechanic
 # Mechanic registry: maps mechanic type to class
 MECHANIC_REGISTRY: dict[str, type[CoreMechanic]] = {}
 
+# Snapshot of registered type names, refreshed by register_mechanic so that
+# lookups of the name list do not rebuild it from the registry every call
+_MECHANIC_TYPES: tuple[str, ...] = ()
+
 
 def register_mechanic(cls: type[CoreMechanic]) -> type[CoreMechanic]:
     """Decorator to register a mechanic class in the registry."""
+    global _MECHANIC_TYPES
     MECHANIC_REGISTRY[cls.TYPE] = cls
+    _MECHANIC_TYPES = tuple(MECHANIC_REGISTRY)
     return cls
 
 
@@ -39,14 +45,14 @@ def create_mechanic(type_: str, config: dict[str, Any]) -> CoreMechanic:
     if mechanic_class is None:
         raise ValueError(
             f"Unknown mechanic type: '{type_}'. "
-            f"Available types: {list(MECHANIC_REGISTRY.keys())}"
+            f"Available types: {list(_MECHANIC_TYPES)}"
         )
     return mechanic_class.from_config(config)
 
 
 def get_registered_mechanics() -> list[str]:
     """Return list of all registered mechanic types."""
-    return list(MECHANIC_REGISTRY.keys())
+    return list(_MECHANIC_TYPES)
 
 
 # Import all mechanics to register them (each uses @register_mechanic decorator)
@@ -67,7 +67,7 @@ class VotingMechanicVoteAction(Action):
             return False, {"error": msg}, f"{agent.name} vote failed: {msg}", {}, False
 
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     """A voting proposal."""
 
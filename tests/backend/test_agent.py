@@ -489,6 +489,40 @@ class TestAgentKnowledgeBase:
         # Title match should be ranked higher
         assert results[0]["id"] == "k1"
 
+    def test_query_knowledge_sees_edited_items(self):
+        """Test that editing an item in place is picked up by the next query."""
+        item = {"id": "k1", "title": "Weather", "content": "The sky is blue", "enabled": True}
+        agent = Agent(
+            name="EditQueryAgent",
+            user_profile="Profile",
+            style="neutral",
+            action_space=[],
+            knowledge_base=[item],
+        )
+        assert agent.query_knowledge("sky") == [item]
+        item["content"] = "Grass is green"
+        assert agent.query_knowledge("sky") == []
+        assert agent.query_knowledge("grass") == [item]
+
+    def test_query_knowledge_drops_removed_items(self):
+        """Test that removed items do not stay in the per-agent term cache."""
+        agent = Agent(
+            name="RemoveQueryAgent",
+            user_profile="Profile",
+            style="neutral",
+            action_space=[],
+            knowledge_base=[
+                {"id": "k1", "title": "Weather", "content": "The sky is blue", "enabled": True},
+                {"id": "k2", "title": "Food", "content": "Apples are red", "enabled": True},
+            ],
+        )
+        agent.query_knowledge("sky")
+        assert len(agent._knowledge_terms_cache) == 2
+        agent.remove_knowledge("k1")
+        assert agent.query_knowledge("sky") == []
+        assert len(agent._knowledge_terms_cache) == 1
+        assert "_knowledge_terms_cache" not in agent.serialize()
+
     def test_get_knowledge_context_with_query(self):
         """Test getting formatted knowledge context with query."""
         agent = Agent(
@@ -918,6 +952,67 @@ Goals: Collect food
         assert len(result) == 1
         assert result[0]["action"] == "test"
 
+    def test_parse_action_code_fences_and_whitespace(self):
+        """Test that fences and surrounding whitespace around a full block are ignored."""
+        result = parse_actions(
+            '  \n```xml\n<Action name="send_message"><message>Hi</message></Action>\n```\n  '
+        )
+        assert result == [{"action": "send_message", "message": "Hi"}]
+
+    def test_parse_action_self_closing_in_code_fences(self):
+        """Test parsing self-closing action wrapped in bare code fences."""
+        result = parse_actions('```\n<Action name="yield" />\n```')
+        assert result == [{"action": "yield"}]
+
+    def test_parse_action_self_closing_and_element_forms_agree(self):
+        """Test that self-closing and empty element forms parse the same."""
+        expected = [{"action": "yield"}]
+        assert parse_actions('<Action name="yield"/>') == expected
+        assert parse_actions('<Action name="yield" />') == expected
+        assert parse_actions('<Action name="yield"></Action>') == expected
+        assert parse_actions('<Action name="yield">\n</Action>') == expected
+
+    def test_parse_action_element_form_preferred(self):
+        """Test that an element form is picked over a later self-closing tag."""
+        result = parse_actions(
+            '<Action name="send_message"><message>Hi</message></Action> <Action name="yield" />'
+        )
+        assert result == [{"action": "send_message", "message": "Hi"}]
+
+    def test_parse_action_self_closing_before_element_form(self):
+        """Test that an element form spanning an earlier self-closing tag is rejected."""
+        # The element pattern matches from the first <Action to the last
+        # </Action>, which is not well-formed XML.
+        result = parse_actions(
+            '<Action name="yield" /> <Action name="send_message"><message>Hi</message></Action>'
+        )
+        assert result == []
+
+    def test_parse_action_without_action_tag(self):
+        """Test that blocks without an <Action tag yield no actions."""
+        assert parse_actions("no tags here") == []
+        assert parse_actions("<Plan>keep going</Plan>") == []
+        assert parse_actions("<action name=\"yield\" />") == []
+
+    def test_parse_action_bare_name_matches_element_tree(self):
+        """Test that the parameterless fast path returns what ET would."""
+        import xml.etree.ElementTree as ET
+
+        for text in ('<Action name="yield"/>', '<Action  name="send_message" ></Action>'):
+            root = ET.fromstring(text)
+            assert parse_actions(text) == [{"action": root.attrib["name"]}]
+
+    def test_parse_action_bare_name_with_entity(self):
+        """Test that names containing entities fall back to ET and are unescaped."""
+        assert parse_actions('<Action name="a&amp;b" />') == [{"action": "a&b"}]
+        assert parse_actions('<Action name="a&amp;b"></Action>') == [{"action": "a&b"}]
+        assert parse_actions('<Action name="x&y" />') == [{"action": "x&y"}]
+
+    def test_parse_action_bare_name_with_whitespace(self):
+        """Test that tabs and newlines in names are normalized the way ET does."""
+        assert parse_actions('<Action name="a\nb" />') == [{"action": "a b"}]
+        assert parse_actions('<Action name="a\tb"></Action>') == [{"action": "a b"}]
+
 
 # =============================================================================
 # Serialization Tests
@@ -1085,6 +1180,37 @@ class TestAgentSerialization:
         assert len(agent.short_memory.get_all()) == 1
         assert agent.short_memory.get_all()[0]["content"] == "Test message"
 
+    def test_deserialize_memory_with_non_dict_entry(self):
+        """Test deserialization keeps malformed memory entries instead of failing."""
+        data = {
+            "name": "OddMemoryAgent",
+            "user_profile": "Profile",
+            "style": "neutral",
+            "initial_instruction": "",
+            "role_prompt": "",
+            "language": "en",
+            "action_space": [],
+            "short_memory": [
+                "stray string",
+                {"role": "user", "content": "Test message", "images": [], "audio": [], "video": []},
+            ],
+            "last_history_length": 2,
+            "max_repeat": MAX_REPEAT,
+            "properties": {},
+            "plan_state": {"goals": [], "milestones": [], "strategy": "", "notes": ""},
+            "emotion": "neutral",
+            "emotion_enabled": False,
+            "knowledge_base": [],
+            "documents": {},
+            "consecutive_llm_errors": 0,
+            "is_offline": False,
+            "max_consecutive_llm_errors": 3,
+        }
+        agent = Agent.deserialize(data)
+        history = agent.short_memory.get_all()
+        assert history[0] == "stray string"
+        assert history[1]["role"] == "user"
+
     def test_deserialize_with_knowledge_base(self):
         """Test deserialization restores knowledge base."""
         data = {
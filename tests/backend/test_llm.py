@@ -15,6 +15,7 @@ Tests for:
 import os
 import json
 import random
+import threading
 from unittest.mock import Mock, MagicMock, patch
 from concurrent.futures import TimeoutError as FutTimeout
 
@@ -1032,6 +1033,70 @@ class TestGenerateAgentsWithArchetypes:
         assert "archetype_id" in agent["properties"]
         assert "openness" in agent["properties"]
 
+    @patch('socialsim4.core.llm.generation.generate_archetype_template')
+    def test_generate_agents_concurrent_keeps_archetype_order(self, mock_template):
+        """Test templates match their archetypes when calls finish out of order."""
+        last_done = threading.Event()
+        finished = []
+
+        def template_for(arch, llm_client, language):
+            # The first archetype's call only returns after the last one has
+            if arch["id"] == "arch_0":
+                assert last_done.wait(timeout=5)
+            result = {"description": f"bio {arch['id']}", "roles": [arch["label"]]}
+            finished.append(arch["id"])
+            if arch["id"] == "arch_2":
+                last_done.set()
+            return result
+
+        mock_template.side_effect = template_for
+
+        demographics = [{"name": "type", "categories": ["A", "B", "C"]}]
+        traits = [{"name": "openness", "mean": 50, "std": 10}]
+        config = LLMConfig(dialect="mock")
+        llm_client = LLMClient(config)
+
+        agents = generate_agents_with_archetypes(
+            total_agents=3,
+            demographics=demographics,
+            archetype_probabilities=None,
+            traits=traits,
+            llm_client=llm_client,
+            max_workers=3,
+        )
+
+        assert finished.index("arch_2") < finished.index("arch_0")
+        assert [a["properties"]["archetype_id"] for a in agents] == ["arch_0", "arch_1", "arch_2"]
+        for agent in agents:
+            arch_id = agent["properties"]["archetype_id"]
+            assert agent["profile"] == f"bio {arch_id}"
+            assert agent["role"] == agent["properties"]["archetype_label"]
+
+    @patch('socialsim4.core.llm.generation.generate_archetype_template')
+    def test_generate_agents_concurrent_propagates_failure(self, mock_template):
+        """Test that a failing archetype call fails the whole generation."""
+        def template_for(arch, llm_client, language):
+            if arch["id"] == "arch_1":
+                raise RuntimeError("No JSON found in LLM response")
+            return {"description": "A test agent", "roles": ["Doctor"]}
+
+        mock_template.side_effect = template_for
+
+        demographics = [{"name": "type", "categories": ["A", "B", "C"]}]
+        traits = [{"name": "openness", "mean": 50, "std": 10}]
+        config = LLMConfig(dialect="mock")
+        llm_client = LLMClient(config)
+
+        with pytest.raises(RuntimeError, match="No JSON found"):
+            generate_agents_with_archetypes(
+                total_agents=3,
+                demographics=demographics,
+                archetype_probabilities=None,
+                traits=traits,
+                llm_client=llm_client,
+                max_workers=3,
+            )
+
     @patch('socialsim4.core.llm.generation.generate_archetype_template')
     def test_generate_agents_language_chinese(self, mock_template):
         """Test agent generation with Chinese language."""
@@ -257,3 +257,98 @@ def test_llm_client_pool_does_not_mutate_base_clients():
 
     # 原始 base_client.flag 仍然保持 False，说明 clone 生效
     assert base_client.flag is False
+
+
+# ------------------------------------------------------------------------
+# 6) 测试：超时后的重试不会与仍在运行的上一次调用重叠
+# ------------------------------------------------------------------------
+def test_llm_client_timeout_retry_does_not_overlap_running_call():
+    """
+    场景：底层调用超时，但工作线程里的调用仍在继续执行。
+
+    期望：
+    - 重试会等上一次调用真正结束后才发起，同一时刻最多只有 1 个调用在执行；
+    - 被放弃的调用在结束前一直占用信号量名额，结束后名额全部归还。
+    """
+
+    cfg = make_mock_config()
+    client = LLMClient(cfg)
+
+    client.timeout_s = 0.05
+    client.max_retries = 1
+    client.retry_backoff_s = 0.0
+
+    from threading import BoundedSemaphore
+
+    client._sem = BoundedSemaphore(2)
+
+    class SlowModel:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.calls = 0
+            self.current_active = 0
+            self.max_seen = 0
+            self.done = threading.Event()
+
+        def chat(self, messages):
+            with self.lock:
+                self.calls += 1
+                self.current_active += 1
+                self.max_seen = max(self.max_seen, self.current_active)
+            try:
+                time.sleep(0.2)
+                return "LATE"
+            finally:
+                with self.lock:
+                    self.current_active -= 1
+                    if self.calls == 2 and self.current_active == 0:
+                        self.done.set()
+
+    slow = SlowModel()
+    client.client = slow
+
+    with pytest.raises(FutTimeout):
+        client.chat([{"role": "user", "content": "hello"}])
+
+    assert slow.calls == 2
+    assert slow.max_seen == 1
+
+    # 最后一次被放弃的调用结束后，两个名额都应归还
+    assert slow.done.wait(2.0)
+    time.sleep(0.05)
+    assert client._sem.acquire(blocking=False)
+    assert client._sem.acquire(blocking=False)
+
+
+# ------------------------------------------------------------------------
+# 7) 测试：在共享线程池中排队的时间不计入超时
+# ------------------------------------------------------------------------
+def test_llm_client_timeout_excludes_executor_queue_time(monkeypatch):
+    """
+    场景：共享线程池只有 1 个线程，且正被另一个任务占用一段时间。
+
+    期望：排队时间不计入 timeout_s，调用本身足够快，因此成功返回而不是超时。
+    """
+    from socialsim4.core.llm import client as client_module
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(client_module, "_executor", pool)
+
+    cfg = make_mock_config()
+    client = LLMClient(cfg)
+    client.timeout_s = 0.1
+    client.max_retries = 0
+
+    class FastModel:
+        def chat(self, messages):
+            return "OK"
+
+    client.client = FastModel()
+
+    try:
+        # 占住唯一的工作线程，时间长于 timeout_s
+        blocker = pool.submit(time.sleep, 0.3)
+        assert client.chat([{"role": "user", "content": "hi"}]) == "OK"
+        blocker.result()
+    finally:
+        pool.shutdown(wait=True)
@@ -0,0 +1,79 @@
+import datetime
+import json
+import math
+
+import pytest
+
+from socialsim4.core import jsonutil
+from socialsim4.core.jsonutil import json_copy
+
+requires_orjson = pytest.mark.skipif(jsonutil.orjson is None, reason="orjson not installed")
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    monkeypatch.setattr(jsonutil, "orjson", None)
+
+
+def test_json_copy_plain_data_is_independent():
+    data = {"a": [1, 2.5, "x", None, True], "b": {"c": []}}
+    copied = json_copy(data)
+    assert copied == data
+    assert copied["a"] is not data["a"]
+    assert copied["b"]["c"] is not data["b"]["c"]
+
+
+def test_json_copy_stringifies_non_str_keys():
+    assert json_copy({1: "a", 2.5: "b"}) == json.loads(json.dumps({1: "a", 2.5: "b"}))
+
+
+def test_json_copy_big_int_falls_back_to_stdlib():
+    big = 2**70
+    assert json_copy({"n": big}) == {"n": big}
+
+
+@requires_orjson
+def test_json_copy_orjson_drops_nan_and_infinity():
+    copied = json_copy({"nan": float("nan"), "inf": float("inf")})
+    assert copied == {"nan": None, "inf": None}
+
+
+@requires_orjson
+def test_json_copy_orjson_converts_non_json_types():
+    assert json_copy({"d": datetime.date(2020, 1, 1)}) == {"d": "2020-01-01"}
+
+
+def test_json_copy_stdlib_keeps_nan(stdlib_only):
+    copied = json_copy({"x": float("nan")})
+    assert math.isnan(copied["x"])
+
+
+def test_json_copy_stdlib_rejects_non_json_types(stdlib_only):
+    with pytest.raises(TypeError):
+        json_copy({"d": datetime.date(2020, 1, 1)})
+
+
+def test_json_dumps_round_trips_plain_data():
+    data = {"a": [1, "é", None], 1: 2}
+    assert json.loads(jsonutil.json_dumps(data)) == json.loads(json.dumps(data))
+
+
+def test_json_dumps_big_int_falls_back_to_stdlib():
+    assert jsonutil.json_dumps(2**70) == str(2**70)
+
+
+def test_json_dumps_rejects_unserializable_objects():
+    with pytest.raises(TypeError):
+        jsonutil.json_dumps({"x": object()})
+
+
+@requires_orjson
+def test_json_dumps_orjson_writes_nan_as_null_and_encodes_dates():
+    encoded = jsonutil.json_dumps({"x": float("nan"), "d": datetime.date(2020, 1, 1)})
+    assert json.loads(encoded) == {"x": None, "d": "2020-01-01"}
+
+
+def test_json_dumps_stdlib_keeps_nan_and_rejects_dates(stdlib_only):
+    assert jsonutil.json_dumps(float("nan")) == "NaN"
+    with pytest.raises(TypeError):
+        jsonutil.json_dumps(datetime.date(2020, 1, 1))
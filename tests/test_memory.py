@@ -0,0 +1,72 @@
+from socialsim4.core.memory import ShortTermMemory
+
+
+def test_same_role_text_messages_merge():
+    mem = ShortTermMemory()
+    mem.append("user", "a")
+    mem.append("user", "b")
+    mem.append("assistant", "c")
+    mem.append("user", "d")
+
+    history = mem.get_all()
+    assert [(m["role"], m["content"]) for m in history] == [
+        ("user", "a\nb"),
+        ("assistant", "c"),
+        ("user", "d"),
+    ]
+    assert len(mem) == 3
+
+
+def test_media_messages_are_not_merged():
+    mem = ShortTermMemory()
+    mem.append("user", "a")
+    mem.append("user", {"text": "b", "images": ["http://example.com/x.png"]})
+    mem.append("user", "c")
+
+    history = mem.get_all()
+    assert [m["content"] for m in history] == ["a", "b", "c"]
+    assert history[1]["images"] == ["http://example.com/x.png"]
+
+
+def test_read_flushes_pending_merge():
+    mem = ShortTermMemory()
+    mem.append("user", "a")
+    earlier = mem.get_all()
+    mem.append("user", "b")
+    mem.append("user", "c")
+
+    # A list read before the appends is not updated by them...
+    assert earlier[-1]["content"] == "a"
+    # ...but reading again applies the pending merge.
+    assert mem.get_all()[-1]["content"] == "a\nb\nc"
+    assert mem.history[-1]["content"] == "a\nb\nc"
+
+
+def test_setter_resets_pending_merge():
+    mem = ShortTermMemory()
+    mem.append("user", "a")
+    mem.append("user", "b")
+    mem.history = [{"role": "user", "content": "x", "images": [], "audio": [], "video": []}]
+
+    assert [m["content"] for m in mem.get_all()] == ["x"]
+    mem.append("user", "y")
+    assert [m["content"] for m in mem.get_all()] == ["x\ny"]
+
+    mem.clear()
+    assert mem.get_all() == []
+    assert len(mem) == 0
+
+
+def test_serialize_round_trip():
+    mem = ShortTermMemory()
+    mem.append("system", "rules")
+    mem.append("user", "a")
+    mem.append("user", "b")
+    mem.append("assistant", {"text": "c", "audio": ["http://example.com/a.mp3"]})
+
+    serialized = mem.searilize()
+    assert serialized[1]["content"] == "a\nb"
+
+    restored = ShortTermMemory()
+    restored.history = serialized
+    assert restored.searilize() == serialized
@@ -3,8 +3,6 @@ Tests for the Template Loader module.
 """
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 import yaml
@@ -96,7 +94,7 @@ class TestLoadJsonTemplate:
 class TestLoadFromFile:
     """Tests for loading templates from files."""
 
-    def test_load_from_json_file(self):
+    def test_load_from_json_file(self, tmp_path):
         """Test loading a template from a JSON file."""
         data = {
             "id": "json_template",
@@ -107,24 +105,18 @@ class TestLoadFromFile:
             ],
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            json.dump(data, f)
-            path = f.name
+        path = tmp_path / "template.json"
+        path.write_text(json.dumps(data))
 
-        try:
-            loader = TemplateLoader()
-            template = loader.load_from_file(path)
+        loader = TemplateLoader()
+        template = loader.load_from_file(path)
 
-            assert template.id == "json_template"
-            assert template.name == "JSON Template"
-            assert len(template.core_mechanics) == 1
-            assert template.core_mechanics[0].config["width"] == 15
-        finally:
-            Path(path).unlink()
+        assert template.id == "json_template"
+        assert template.name == "JSON Template"
+        assert len(template.core_mechanics) == 1
+        assert template.core_mechanics[0].config["width"] == 15
 
-    def test_load_from_yaml_file(self):
+    def test_load_from_yaml_file(self, tmp_path):
         """Test loading a template from a YAML file."""
         data = {
             "id": "yaml_template",
@@ -135,24 +127,18 @@ class TestLoadFromFile:
             ],
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            yaml.dump(data, f)
-            path = f.name
+        path = tmp_path / "template.yaml"
+        path.write_text(yaml.dump(data))
 
-        try:
-            loader = TemplateLoader()
-            template = loader.load_from_file(path)
+        loader = TemplateLoader()
+        template = loader.load_from_file(path)
 
-            assert template.id == "yaml_template"
-            assert template.name == "YAML Template"
-            assert len(template.core_mechanics) == 1
-            assert template.core_mechanics[0].config["threshold"] == 0.75
-        finally:
-            Path(path).unlink()
+        assert template.id == "yaml_template"
+        assert template.name == "YAML Template"
+        assert len(template.core_mechanics) == 1
+        assert template.core_mechanics[0].config["threshold"] == 0.75
 
-    def test_load_from_yml_extension(self):
+    def test_load_from_yml_extension(self, tmp_path):
         """Test loading a template from .yml file."""
         data = {
             "id": "yml_template",
@@ -160,19 +146,13 @@ class TestLoadFromFile:
             "description": "Loaded from YML",
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yml", delete=False
-        ) as f:
-            yaml.dump(data, f)
-            path = f.name
+        path = tmp_path / "template.yml"
+        path.write_text(yaml.dump(data))
 
-        try:
-            loader = TemplateLoader()
-            template = loader.load_from_file(path)
+        loader = TemplateLoader()
+        template = loader.load_from_file(path)
 
-            assert template.id == "yml_template"
-        finally:
-            Path(path).unlink()
+        assert template.id == "yml_template"
 
     def test_load_from_file_not_found_raises_error(self):
         """Test that loading non-existent file raises FileNotFoundError."""
@@ -181,55 +161,48 @@ class TestLoadFromFile:
         with pytest.raises(FileNotFoundError, match="not found"):
             loader.load_from_file("/nonexistent/path/template.json")
 
-    def test_load_from_file_unsupported_extension_raises_error(self):
+    def test_load_from_file_unsupported_extension_raises_error(self, tmp_path):
         """Test that unsupported file extension raises ValueError."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("not a valid format")
-            path = f.name
+        path = tmp_path / "template.txt"
+        path.write_text("not a valid format")
 
-        try:
-            loader = TemplateLoader()
-            with pytest.raises(ValueError, match="Unsupported file format"):
-                loader.load_from_file(path)
-        finally:
-            Path(path).unlink()
+        loader = TemplateLoader()
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            loader.load_from_file(path)
 
 
 class TestLoadFromDirectory:
     """Tests for loading multiple templates from a directory."""
 
-    def test_load_from_directory(self):
+    def test_load_from_directory(self, tmp_path):
         """Test loading all templates from a directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create JSON template
-            json_data = {
-                "id": "json_template",
-                "name": "JSON Template",
-                "description": "From JSON",
-            }
-            json_path = Path(tmpdir) / "template1.json"
-            with open(json_path, "w") as f:
-                json.dump(json_data, f)
-
-            # Create YAML template
-            yaml_data = {
-                "id": "yaml_template",
-                "name": "YAML Template",
-                "description": "From YAML",
-            }
-            yaml_path = Path(tmpdir) / "template2.yaml"
-            with open(yaml_path, "w") as f:
-                yaml.dump(yaml_data, f)
-
-            loader = TemplateLoader()
-            templates = loader.load_from_directory(tmpdir)
-
-            assert len(templates) == 2
-            template_ids = {t.id for t in templates}
-            assert "json_template" in template_ids
-            assert "yaml_template" in template_ids
+        # Create JSON template
+        json_data = {
+            "id": "json_template",
+            "name": "JSON Template",
+            "description": "From JSON",
+        }
+        json_path = tmp_path / "template1.json"
+        with open(json_path, "w") as f:
+            json.dump(json_data, f)
+
+        # Create YAML template
+        yaml_data = {
+            "id": "yaml_template",
+            "name": "YAML Template",
+            "description": "From YAML",
+        }
+        yaml_path = tmp_path / "template2.yaml"
+        with open(yaml_path, "w") as f:
+            yaml.dump(yaml_data, f)
+
+        loader = TemplateLoader()
+        templates = loader.load_from_directory(tmp_path)
+
+        assert len(templates) == 2
+        template_ids = {t.id for t in templates}
+        assert "json_template" in template_ids
+        assert "yaml_template" in template_ids
 
     def test_load_from_directory_not_found_raises_error(self):
         """Test that non-existent directory raises FileNotFoundError."""
@@ -238,29 +211,28 @@ class TestLoadFromDirectory:
         with pytest.raises(FileNotFoundError, match="not found"):
             loader.load_from_directory("/nonexistent/directory")
 
-    def test_load_from_directory_with_template_dir(self):
+    def test_load_from_directory_with_template_dir(self, tmp_path):
         """Test loading from relative path with template_dir set."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create subdirectory
-            subdir = Path(tmpdir) / "templates"
-            subdir.mkdir()
-
-            # Create template file
-            data = {
-                "id": "relative_template",
-                "name": "Relative Template",
-                "description": "Loaded with relative path",
-            }
-            template_path = subdir / "template.json"
-            with open(template_path, "w") as f:
-                json.dump(data, f)
-
-            # Load with template_dir set
-            loader = TemplateLoader(template_dir=subdir)
-            templates = loader.load_from_directory(".")
-
-            assert len(templates) == 1
-            assert templates[0].id == "relative_template"
+        # Create subdirectory
+        subdir = tmp_path / "templates"
+        subdir.mkdir()
+
+        # Create template file
+        data = {
+            "id": "relative_template",
+            "name": "Relative Template",
+            "description": "Loaded with relative path",
+        }
+        template_path = subdir / "template.json"
+        with open(template_path, "w") as f:
+            json.dump(data, f)
+
+        # Load with template_dir set
+        loader = TemplateLoader(template_dir=subdir)
+        templates = loader.load_from_directory(".")
+
+        assert len(templates) == 1
+        assert templates[0].id == "relative_template"
 
 
 class TestBuildSceneWithGridMechanic: